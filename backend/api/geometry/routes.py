@@ -1,161 +1,276 @@
 from __future__ import annotations
 
-from flask import request, jsonify, current_app
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from flask import Response, request, jsonify, current_app
+from werkzeug.exceptions import HTTPException
 
 from backend.api.geometry import geometry_bp
-from backend.app.container import get_session_service, get_geometry_service
+from backend.app.container import geometry_service
+from backend.domain.vectors import Site
 from backend.services.geometry_service import GeometryError, GeometryNotFoundError
 from backend.services.session_service import SessionNotFoundError
+from backend.api.geometry.validation import (
+    ValidationError,
+    validate_point_create,
+    validate_point_update,
+    validate_recalculate,
+    validate_segment_create,
+    validate_segment_update,
+)
+
+# Serialized geometry bodies keyed by (session_id, mtime stamp, format).
+# The stamp is current.json's st_mtime_ns, which changes on every durable
+# write - unlike the version number, which undo reissues - so entries never
+# go stale; the size bound keeps memory in check.
+_SERIALIZED_GEOMETRY_CACHE: OrderedDict[tuple[int, int, str], bytes] = OrderedDict()
+_SERIALIZED_GEOMETRY_CACHE_MAX = 64
+
+# Sites with more objects than this stream their JSON chunk by chunk instead
+# of buffering (and caching) one large body.
+_STREAM_OBJECT_THRESHOLD = 2000
+
+
+# Typed response envelopes for the mutation endpoints. orjson serializes
+# dataclasses natively (no intermediate dict per response) and the stdlib
+# provider falls back to dataclasses.asdict, so these work with either
+# JSON provider. slots=True keeps the per-request instances dict-free.
+
+@dataclass(slots=True)
+class _MutationResponse:
+    success: bool
+    version: int
+
+
+@dataclass(slots=True)
+class _PointResponse:
+    success: bool
+    version: int
+    point: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class _SegmentResponse:
+    success: bool
+    version: int
+    segment: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class _BatchResponse:
+    success: bool
+    version: int
+    addedPointIds: List[str]
+    addedSegmentIds: List[str]
+    updatedPointIds: List[str]
+
+
+# ----------------------------------------------------------------------------
+# Shared error handling
+#
+# One blueprint-level handler per exception family replaces the identical
+# try/except cascade previously duplicated in every view, keeping the happy
+# path of each handler free of exception setup.
+# ----------------------------------------------------------------------------
+
+@geometry_bp.errorhandler(ValidationError)
+def _handle_validation_error(e: ValidationError):
+    return jsonify({"success": False, "message": str(e)}), 400
+
+
+@geometry_bp.errorhandler(SessionNotFoundError)
+def _handle_session_not_found(e: SessionNotFoundError):
+    return jsonify({"success": False, "message": str(e)}), 404
+
+
+@geometry_bp.errorhandler(GeometryNotFoundError)
+def _handle_geometry_not_found(e: GeometryNotFoundError):
+    return jsonify({"success": False, "message": str(e)}), 404
+
+
+@geometry_bp.errorhandler(GeometryError)
+def _handle_geometry_error(e: GeometryError):
+    return jsonify({"success": False, "message": str(e)}), 400
+
+
+@geometry_bp.errorhandler(ValueError)
+@geometry_bp.errorhandler(TypeError)
+def _handle_bad_data(e: Exception):
+    return jsonify({"success": False, "message": f"Invalid data: {e}"}), 400
+
+
+@geometry_bp.errorhandler(Exception)
+def _handle_unexpected_error(e: Exception):
+    if isinstance(e, HTTPException):
+        return e
+    current_app.logger.error(f"Unhandled error in geometry endpoint: {e}", exc_info=True)
+    return jsonify({"success": False, "message": f"Internal server error: {e}"}), 500
+
+
+def _serialize_frontend_site(site) -> bytes:
+    """Serialize a Site to frontend JSON bytes (points/segments always present)."""
+    frontend_json = site.to_frontend_json()
+
+    # Ensure we have points and segments arrays even if empty
+    if 'points' not in frontend_json:
+        frontend_json['points'] = []
+    if 'segments' not in frontend_json:
+        frontend_json['segments'] = []
+
+    return current_app.json.dumps(frontend_json).encode("utf-8")
+
+
+def _remember_geometry_bytes(session_id: int, stamp: int, fmt: str, body: bytes) -> None:
+    """Memoize serialized geometry for (session_id, stamp, format).
+
+    The payload is a pure function of that triple, so concurrent viewers and
+    client reloads of unchanged state reuse a single serialization.
+    """
+    _SERIALIZED_GEOMETRY_CACHE[(session_id, stamp, fmt)] = body
+    while len(_SERIALIZED_GEOMETRY_CACHE) > _SERIALIZED_GEOMETRY_CACHE_MAX:
+        _SERIALIZED_GEOMETRY_CACHE.popitem(last=False)
 
 
 @geometry_bp.post("/api/geometry/<int:session_id>/point")
 def add_point(session_id: int):
     """Add a point to the geometry."""
-    try:
-        data = request.json or {}
-        x = float(data.get("x", 0))
-        y = float(data.get("y", 0))
-        attributes = data.get("attributes")
-        
-        geometry_service = get_geometry_service()
-        result = geometry_service.add_point(session_id, x, y, attributes)
-        
-        # result is now a Site object
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            # Backward compatibility: result is dict, load as Site
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        # Get the last added point
-        points = site.points
-        last_point = points[-1].to_frontend_json() if points else None
-        
-        return jsonify({
-            "success": True,
-            "version": site.version,
-            "point": last_point
-        }), 200
-    except (ValueError, TypeError) as e:
-        return jsonify({"success": False, "message": f"Invalid coordinates: {e}"}), 400
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error adding point: {e}", exc_info=True)
-        import traceback
-        current_app.logger.error(f"Traceback: {traceback.format_exc()}")
-        return jsonify({"success": False, "message": f"Internal server error: {str(e)}"}), 500
+    data = request.get_json(silent=True) or {}
+    x, y, attributes = validate_point_create(data)
+
+    site, point = geometry_service.add_point(session_id, x, y, attributes)
+
+    return jsonify(_PointResponse(True, site.version, point.to_frontend_json())), 200
 
 
 @geometry_bp.get("/api/geometry/<int:session_id>")
 def get_geometry(session_id: int):
     """Get current geometry state for a session."""
-    try:
-        geometry_service = get_geometry_service()
+    # Cheap version-only read: lets us answer 304 without building the
+    # Site object graph or serializing anything.
+    # Column-major (structure-of-arrays) point layout or a newline-delimited
+    # record stream on request; the default stays the row-per-point frontend
+    # format.
+    requested = request.args.get("format")
+    fmt = requested if requested in ("columnar", "jsonl") else "frontend"
+
+    version, stamp = geometry_service.get_current_state_stamp(session_id)
+    etag = f"{session_id}-{version}-{stamp}-{fmt}"
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304)
+
+    if fmt == "jsonl":
+        # One parseable record per line; never materialized as one payload,
+        # so it bypasses the serialized-bytes cache.
         site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
+        if site.session_id is None:
+            site.session_id = session_id
+        response = Response(site.iter_frontend_jsonl(), mimetype="application/x-ndjson")
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "private, must-revalidate"
+        return response
+
+    body = _SERIALIZED_GEOMETRY_CACHE.get((session_id, stamp, fmt))
+    if body is None:
+        site = geometry_service.load_current_geometry(session_id, as_site=True)
+
         # Ensure session_id is set for proper frontend JSON conversion
         if site.session_id is None:
             site.session_id = session_id
-        
-        # Convert to frontend JSON format
-        frontend_json = site.to_frontend_json()
-        
-        # Ensure we have points and segments arrays even if empty
-        if 'points' not in frontend_json:
-            frontend_json['points'] = []
-        if 'segments' not in frontend_json:
-            frontend_json['segments'] = []
-        
-        return jsonify(frontend_json), 200
-    except SessionNotFoundError as e:
-        return jsonify({"message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error loading geometry: {e}", exc_info=True)
-        import traceback
-        current_app.logger.error(f"Traceback: {traceback.format_exc()}")
-        return jsonify({"message": f"Internal server error: {str(e)}"}), 500
+
+        if fmt == "columnar":
+            body = current_app.json.dumps(site.to_columnar_json()).encode("utf-8")
+            _remember_geometry_bytes(session_id, stamp, fmt, body)
+        elif len(site.points) + len(site.get_all_segments()) > _STREAM_OBJECT_THRESHOLD:
+            # Large payload: stream chunk by chunk so serialization
+            # overlaps the socket write and peak memory stays flat.
+            response = Response(
+                site.iter_frontend_chunks(), mimetype="application/json"
+            )
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = "private, must-revalidate"
+            return response
+        else:
+            body = _serialize_frontend_site(site)
+            _remember_geometry_bytes(session_id, stamp, fmt, body)
+
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, must-revalidate"
+    return response
+
+
+@geometry_bp.post("/api/geometry/<int:session_id>/batch")
+def batch_modify(session_id: int):
+    """Apply many adds and point updates in a single versioned save."""
+    data = request.get_json(silent=True) or {}
+    points = data.get("points") or []
+    segments = data.get("segments") or []
+    point_updates = data.get("pointUpdates") or []
+
+    if (
+        not isinstance(points, list)
+        or not isinstance(segments, list)
+        or not isinstance(point_updates, list)
+    ):
+        raise ValidationError("points, segments and pointUpdates must be arrays")
+    if not points and not segments and not point_updates:
+        raise ValidationError("No points or segments provided")
+
+    site, added_point_ids, added_segment_ids, updated_point_ids = (
+        geometry_service.add_batch(
+            session_id,
+            points=points,
+            segments=segments,
+            point_updates=point_updates,
+            action=data.get("action", "batch_add")
+        )
+    )
+
+    return jsonify(
+        _BatchResponse(
+            True, site.version, added_point_ids, added_segment_ids, updated_point_ids
+        )
+    ), 200
 
 
 @geometry_bp.post("/api/geometry/<int:session_id>/save")
 def save_geometry(session_id: int):
     """Save geometry data (full state)."""
-    try:
-        data = request.json or {}
-        
-        geometry_service = get_geometry_service()
-        action = data.get("action", "modify")
-        
-        # Convert frontend JSON to Site object if needed
-        from backend.domain.vectors import Site
-        if isinstance(data, dict) and ('collections' in data or 'points' in data or 'segments' in data):
-            # Frontend format - convert to Site
-            data['sessionId'] = session_id
-            site = Site.from_frontend_json(data)
-            result = geometry_service.save_geometry(session_id, site, action)
-        else:
-            # Storage format or backward compatibility
-            result = geometry_service.save_geometry(session_id, data, action)
-        
-        # Get version from result
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        return jsonify({
-            "success": True,
-            "version": site.version
-        }), 200
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error saving geometry: {e}", exc_info=True)
-        return jsonify({"success": False, "message": "Internal server error"}), 500
+    data = request.get_json(silent=True) or {}
+
+    action = data.get("action", "modify")
+
+    # Convert frontend JSON to Site object if needed
+    if isinstance(data, dict) and ('collections' in data or 'points' in data or 'segments' in data):
+        # Frontend format - convert to Site
+        data['sessionId'] = session_id
+        site = Site.from_frontend_json(data)
+        result = geometry_service.save_geometry(session_id, site, action)
+    else:
+        # Storage format or backward compatibility
+        result = geometry_service.save_geometry(session_id, data, action)
+
+    # Get version from result (Site for Site input, storage dict otherwise)
+    version = result.version if isinstance(result, Site) else result.get("version", 0)
+
+    return jsonify(_MutationResponse(True, version)), 200
 
 
 @geometry_bp.put("/api/geometry/<int:session_id>/point/<point_id>")
 def update_point(session_id: int, point_id: str):
     """Update a point in the geometry."""
-    try:
-        data = request.json or {}
-        current_app.logger.info(f"Updating point {point_id} in session {session_id} with data: {data}")
-        
-        x = data.get("x")
-        y = data.get("y")
-        layer = data.get("layer")
-        attributes = data.get("attributes")
-        
-        # Validate that at least one field is provided
-        if x is None and y is None and layer is None and attributes is None:
-            return jsonify({"success": False, "message": "At least one field must be provided"}), 400
-        
-        geometry_service = get_geometry_service()
-        
-        # Convert x and y to float if they are not None
-        x_float = None
-        y_float = None
-        if x is not None:
-            try:
-                x_float = float(x)
-            except (ValueError, TypeError):
-                return jsonify({"success": False, "message": f"Invalid x coordinate: {x}"}), 400
-        
-        if y is not None:
-            try:
-                y_float = float(y)
-            except (ValueError, TypeError):
-                return jsonify({"success": False, "message": f"Invalid y coordinate: {y}"}), 400
-        
-        result = geometry_service.update_point(
+    data = request.get_json(silent=True) or {}
+    current_app.logger.info(f"Updating point {point_id} in session {session_id} with data: {data}")
+
+    x_float, y_float, layer, attributes = validate_point_update(data)
+
+    if layer is None and attributes is None and x_float is not None and y_float is not None:
+        # Common drag case: coordinates only, no attribute merge needed
+        site = geometry_service.move_point(session_id, point_id, x_float, y_float)
+    else:
+        site = geometry_service.update_point(
             session_id,
             point_id,
             x=x_float,
@@ -163,295 +278,86 @@ def update_point(session_id: int, point_id: str):
             layer=layer,
             attributes=attributes
         )
-        
-        # result is now a Site object
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        current_app.logger.info(f"Point {point_id} updated successfully, new version: {site.version}")
-        
-        return jsonify({
-            "success": True,
-            "version": site.version
-        }), 200
-    except (ValueError, TypeError) as e:
-        return jsonify({"success": False, "message": f"Invalid data: {e}"}), 400
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error updating point: {e}", exc_info=True)
-        return jsonify({"success": False, "message": "Internal server error"}), 500
+
+    current_app.logger.info(f"Point {point_id} updated successfully, new version: {site.version}")
+
+    return jsonify(_MutationResponse(True, site.version)), 200
 
 
 @geometry_bp.post("/api/geometry/<int:session_id>/segment")
 def add_segment(session_id: int):
     """Add a line segment to the geometry."""
-    try:
-        data = request.json or {}
-        start_x = float(data.get("startX", 0))
-        start_y = float(data.get("startY", 0))
-        end_x = float(data.get("endX", 0))
-        end_y = float(data.get("endY", 0))
-        attributes = data.get("attributes")
-        
-        geometry_service = get_geometry_service()
-        segment_type = data.get("segmentType", "line")
-        result = geometry_service.add_segment(
-            session_id, start_x, start_y, end_x, end_y, attributes, segment_type=segment_type
-        )
-        
-        # result is now a Site object
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        # Get the last added segment
-        segments = site.get_all_segments()
-        last_segment = segments[-1].to_frontend_json() if segments else None
-        
-        return jsonify({
-            "success": True,
-            "version": site.version,
-            "segment": last_segment
-        }), 200
-    except (ValueError, TypeError) as e:
-        return jsonify({"success": False, "message": f"Invalid coordinates: {e}"}), 400
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error adding segment: {e}", exc_info=True)
-        import traceback
-        current_app.logger.error(f"Traceback: {traceback.format_exc()}")
-        return jsonify({"success": False, "message": f"Internal server error: {str(e)}"}), 500
+    data = request.get_json(silent=True) or {}
+    start_x, start_y, end_x, end_y, attributes, segment_type = validate_segment_create(data)
+
+    site, segment = geometry_service.add_segment(
+        session_id, start_x, start_y, end_x, end_y, attributes, segment_type=segment_type
+    )
+
+    return jsonify(_SegmentResponse(True, site.version, segment.to_frontend_json())), 200
 
 
 @geometry_bp.put("/api/geometry/<int:session_id>/segment/<segment_id>")
 def update_segment(session_id: int, segment_id: str):
     """Update a segment in the geometry."""
-    try:
-        data = request.json or {}
-        current_app.logger.info(f"Updating segment {segment_id} in session {session_id} with data: {data}")
-        
-        start_x = data.get("startX")
-        start_y = data.get("startY")
-        end_x = data.get("endX")
-        end_y = data.get("endY")
-        layer = data.get("layer")
-        attributes = data.get("attributes")
-        
-        # Validate that coordinates are provided
-        if start_x is None or start_y is None or end_x is None or end_y is None:
-            return jsonify({"success": False, "message": "All coordinates must be provided"}), 400
-        
-        geometry_service = get_geometry_service()
-        
-        # Convert to float
-        try:
-            start_x_float = float(start_x)
-            start_y_float = float(start_y)
-            end_x_float = float(end_x)
-            end_y_float = float(end_y)
-        except (ValueError, TypeError) as e:
-            return jsonify({"success": False, "message": f"Invalid coordinates: {e}"}), 400
-        
-        result = geometry_service.update_segment(
-            session_id,
-            segment_id,
-            start_x=start_x_float,
-            start_y=start_y_float,
-            end_x=end_x_float,
-            end_y=end_y_float,
-            layer=layer,
-            attributes=attributes
-        )
-        
-        # result is now a Site object
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        current_app.logger.info(f"Segment {segment_id} updated successfully, new version: {site.version}")
-        
-        return jsonify({
-            "success": True,
-            "version": site.version
-        }), 200
-    except (ValueError, TypeError) as e:
-        return jsonify({"success": False, "message": f"Invalid data: {e}"}), 400
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error updating segment: {e}", exc_info=True)
-        return jsonify({"success": False, "message": "Internal server error"}), 500
+    data = request.get_json(silent=True) or {}
+    current_app.logger.info(f"Updating segment {segment_id} in session {session_id} with data: {data}")
+
+    start_x_float, start_y_float, end_x_float, end_y_float, layer, attributes = (
+        validate_segment_update(data)
+    )
+
+    site = geometry_service.update_segment(
+        session_id,
+        segment_id,
+        start_x=start_x_float,
+        start_y=start_y_float,
+        end_x=end_x_float,
+        end_y=end_y_float,
+        layer=layer,
+        attributes=attributes
+    )
+
+    current_app.logger.info(f"Segment {segment_id} updated successfully, new version: {site.version}")
+
+    return jsonify(_MutationResponse(True, site.version)), 200
 
 
 @geometry_bp.put("/api/geometry/<int:session_id>/segment/<segment_id>/recalculate")
 def recalculate_segment(session_id: int, segment_id: str):
     """Recalculate a line segment using bearing and distance."""
-    try:
-        data = request.json or {}
-        current_app.logger.info(f"Recalculating segment {segment_id} in session {session_id} with data: {data}")
-        
-        # Extract and validate required parameters
-        quadrant = data.get("quadrant")
-        bearing = data.get("bearing")
-        distance = data.get("distance")
-        blocked_point = data.get("blockedPoint", "start_pt")
-        
-        # Validate required fields
-        if quadrant is None:
-            return jsonify({"success": False, "message": "quadrant is required"}), 400
-        if bearing is None:
-            return jsonify({"success": False, "message": "bearing is required"}), 400
-        if distance is None:
-            return jsonify({"success": False, "message": "distance is required"}), 400
-        
-        # Validate quadrant
-        if quadrant not in ["NE", "NW", "SW", "SE"]:
-            return jsonify({"success": False, "message": f"Invalid quadrant: {quadrant}. Must be NE, NW, SW, or SE"}), 400
-        
-        # Validate bearing range (0-90)
-        try:
-            bearing_float = float(bearing)
-            if bearing_float < 0 or bearing_float > 90:
-                return jsonify({"success": False, "message": f"Bearing must be in range 0-90 degrees, got {bearing_float}"}), 400
-        except (ValueError, TypeError):
-            return jsonify({"success": False, "message": f"Invalid bearing: {bearing}"}), 400
-        
-        # Validate distance (> 0)
-        try:
-            distance_float = float(distance)
-            if distance_float <= 0:
-                return jsonify({"success": False, "message": f"Distance must be greater than 0, got {distance_float}"}), 400
-        except (ValueError, TypeError):
-            return jsonify({"success": False, "message": f"Invalid distance: {distance}"}), 400
-        
-        # Validate blocked_point
-        if blocked_point not in ["start_pt", "end_pt"]:
-            return jsonify({"success": False, "message": f"blockedPoint must be 'start_pt' or 'end_pt', got {blocked_point}"}), 400
-        
-        geometry_service = get_geometry_service()
-        
-        # Load current geometry
-        site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        # Find segment
-        segment = site.get_segment_by_id(segment_id)
-        if not segment:
-            return jsonify({"success": False, "message": f"Segment with id {segment_id} not found"}), 404
-        
-        # Check if it's a LineSegment
-        from backend.domain.vectors import LineSegment
-        if not isinstance(segment, LineSegment):
-            return jsonify({"success": False, "message": f"Segment {segment_id} is not a line segment"}), 400
-        
-        # Call the recalculation method
-        segment.recalculate_by_bearing_and_distance(
-            quadrant=quadrant,
-            bearing=bearing_float,
-            distance=distance_float,
-            blocked_point=blocked_point
-        )
-        
-        # Save with versioning
-        result = geometry_service.save_geometry(session_id, site, action="recalculate_segment")
-        
-        # result is now a Site object
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        current_app.logger.info(f"Segment {segment_id} recalculated successfully, new version: {site.version}")
-        
-        return jsonify({
-            "success": True,
-            "version": site.version
-        }), 200
-    except ValueError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error recalculating segment: {e}", exc_info=True)
-        error_msg = f"Internal server error: {str(e)}"
-        current_app.logger.error(f"Error type: {type(e).__name__}")
-        return jsonify({"success": False, "message": error_msg}), 500
+    data = request.get_json(silent=True) or {}
+    current_app.logger.info(f"Recalculating segment {segment_id} in session {session_id} with data: {data}")
+
+    quadrant, bearing_float, distance_float, blocked_point = validate_recalculate(data)
+
+    site = geometry_service.recalculate_segment(
+        session_id,
+        segment_id,
+        quadrant=quadrant,
+        bearing=bearing_float,
+        distance=distance_float,
+        blocked_point=blocked_point
+    )
+
+    current_app.logger.info(f"Segment {segment_id} recalculated successfully, new version: {site.version}")
+
+    return jsonify(_MutationResponse(True, site.version)), 200
 
 
 @geometry_bp.post("/api/geometry/<int:session_id>/undo")
 def undo_action(session_id: int):
     """Undo last action."""
-    try:
-        geometry_service = get_geometry_service()
-        result = geometry_service.undo(session_id, as_site=False)
-        
-        # result is JSON dict
-        version = result.get("version", 0) if isinstance(result, dict) else result.version
-        
-        return jsonify({
-            "success": True,
-            "version": version
-        }), 200
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except GeometryNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except Exception as e:
-        current_app.logger.error(f"Error undoing action: {e}", exc_info=True)
-        return jsonify({"success": False, "message": "Internal server error"}), 500
+    version = geometry_service.undo_and_get_version(session_id)
+
+    return jsonify(_MutationResponse(True, version)), 200
 
 
 @geometry_bp.delete("/api/geometry/<int:session_id>/<object_type>/<object_id>")
 def delete_object(session_id: int, object_type: str, object_id: str):
     """Delete an object (point, segment, parcel, layer) from the geometry."""
-    try:
-        geometry_service = get_geometry_service()
-        result = geometry_service.delete_object(session_id, object_type, object_id)
-        
-        # result is a Site object
-        from backend.domain.vectors import Site
-        if isinstance(result, Site):
-            site = result
-        else:
-            site = geometry_service.load_current_geometry(session_id, as_site=True)
-        
-        current_app.logger.info(f"Object {object_type}/{object_id} deleted successfully, new version: {site.version}")
-        
-        return jsonify({
-            "success": True,
-            "version": site.version
-        }), 200
-    except (ValueError, TypeError) as e:
-        return jsonify({"success": False, "message": f"Invalid data: {e}"}), 400
-    except SessionNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryNotFoundError as e:
-        return jsonify({"success": False, "message": str(e)}), 404
-    except GeometryError as e:
-        return jsonify({"success": False, "message": str(e)}), 400
-    except Exception as e:
-        current_app.logger.error(f"Error deleting object: {e}", exc_info=True)
-        return jsonify({"success": False, "message": "Internal server error"}), 500
+    site = geometry_service.delete_object(session_id, object_type, object_id)
+
+    current_app.logger.info(f"Object {object_type}/{object_id} deleted successfully, new version: {site.version}")
+
+    return jsonify(_MutationResponse(True, site.version)), 200
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+# Allowed enumerations, built once at import so handlers validate against
+# precomputed frozensets instead of rebuilding list literals per request.
+_QUADRANTS = frozenset({"NE", "NW", "SW", "SE"})
+_BLOCKED_POINTS = frozenset({"start_pt", "end_pt"})
+
+
+class ValidationError(ValueError):
+    """Raised when a request payload fails validation."""
+
+
+def validate_point_create(data: Dict[str, Any]) -> Tuple[float, float, Optional[Dict[str, Any]]]:
+    """Validate an add-point payload. Returns (x, y, attributes)."""
+    try:
+        x = float(data.get("x", 0))
+        y = float(data.get("y", 0))
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid coordinates: {e}") from e
+    return x, y, data.get("attributes")
+
+
+def validate_point_update(
+    data: Dict[str, Any],
+) -> Tuple[Optional[float], Optional[float], Optional[str], Optional[Dict[str, Any]]]:
+    """Validate an update-point payload. Returns (x, y, layer, attributes)."""
+    x = data.get("x")
+    y = data.get("y")
+    layer = data.get("layer")
+    attributes = data.get("attributes")
+
+    if x is None and y is None and layer is None and attributes is None:
+        raise ValidationError("At least one field must be provided")
+
+    if x is not None:
+        try:
+            x = float(x)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f"Invalid x coordinate: {data.get('x')}") from e
+    if y is not None:
+        try:
+            y = float(y)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(f"Invalid y coordinate: {data.get('y')}") from e
+
+    return x, y, layer, attributes
+
+
+def validate_segment_create(
+    data: Dict[str, Any],
+) -> Tuple[float, float, float, float, Optional[Dict[str, Any]], str]:
+    """Validate an add-segment payload.
+
+    Returns (start_x, start_y, end_x, end_y, attributes, segment_type).
+    """
+    try:
+        start_x = float(data.get("startX", 0))
+        start_y = float(data.get("startY", 0))
+        end_x = float(data.get("endX", 0))
+        end_y = float(data.get("endY", 0))
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid coordinates: {e}") from e
+    return start_x, start_y, end_x, end_y, data.get("attributes"), data.get("segmentType", "line")
+
+
+def validate_segment_update(
+    data: Dict[str, Any],
+) -> Tuple[float, float, float, float, Optional[str], Optional[Dict[str, Any]]]:
+    """Validate an update-segment payload.
+
+    Returns (start_x, start_y, end_x, end_y, layer, attributes). All four
+    coordinates are required.
+    """
+    start_x = data.get("startX")
+    start_y = data.get("startY")
+    end_x = data.get("endX")
+    end_y = data.get("endY")
+
+    if start_x is None or start_y is None or end_x is None or end_y is None:
+        raise ValidationError("All coordinates must be provided")
+
+    try:
+        coords = (float(start_x), float(start_y), float(end_x), float(end_y))
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid coordinates: {e}") from e
+
+    return coords + (data.get("layer"), data.get("attributes"))
+
+
+def validate_recalculate(data: Dict[str, Any]) -> Tuple[str, float, float, str]:
+    """Validate a recalculate-segment payload.
+
+    Returns (quadrant, bearing, distance, blocked_point).
+    """
+    quadrant = data.get("quadrant")
+    bearing = data.get("bearing")
+    distance = data.get("distance")
+    blocked_point = data.get("blockedPoint", "start_pt")
+
+    if quadrant is None:
+        raise ValidationError("quadrant is required")
+    if bearing is None:
+        raise ValidationError("bearing is required")
+    if distance is None:
+        raise ValidationError("distance is required")
+
+    if quadrant not in _QUADRANTS:
+        raise ValidationError(f"Invalid quadrant: {quadrant}. Must be NE, NW, SW, or SE")
+
+    try:
+        bearing = float(bearing)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid bearing: {data.get('bearing')}") from e
+    if bearing < 0 or bearing > 90:
+        raise ValidationError(f"Bearing must be in range 0-90 degrees, got {bearing}")
+
+    try:
+        distance = float(distance)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid distance: {data.get('distance')}") from e
+    if distance <= 0:
+        raise ValidationError(f"Distance must be greater than 0, got {distance}")
+
+    if blocked_point not in _BLOCKED_POINTS:
+        raise ValidationError(
+            f"blockedPoint must be 'start_pt' or 'end_pt', got {blocked_point}"
+        )
+
+    return quadrant, bearing, distance, blocked_point
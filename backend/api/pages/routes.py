@@ -1,30 +1,62 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from flask import Blueprint, current_app, redirect, render_template, request, url_for
 
+from backend.api.uploads.routes import upload_file_url
 from backend.app.container import get_session_service
 from backend.services.session_service import SessionError, SessionNotFoundError
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 pages_bp = Blueprint("pages", __name__)
 
+# Parsed sessions.json keyed by its mtime; the index page re-reads the file
+# only when something actually rewrote it.
+_SESSIONS_CACHE: dict[str, Any] = {"mtime": -1, "data": []}
+
+# Footer year, refreshed at most hourly; no point calling datetime.now()
+# per page load for a value that changes once a year.
+_YEAR_CACHE: dict[str, Any] = {"checked": 0.0, "year": datetime.now().year}
+
+
+def _current_year() -> int:
+    now = time.time()
+    if now - _YEAR_CACHE["checked"] > 3600:
+        _YEAR_CACHE["year"] = datetime.now().year
+        _YEAR_CACHE["checked"] = now
+    return _YEAR_CACHE["year"]
+
 
 def load_sessions() -> list[dict]:
     """Load sessions from JSON file using Flask instance_path."""
     try:
-        instance_path = Path(current_app.instance_path)
-        sessions_file = instance_path / "sessions.json"
-        
-        if not sessions_file.exists():
+        sessions_file = os.path.join(current_app.instance_path, "sessions.json")
+        try:
+            mtime = os.stat(sessions_file).st_mtime_ns
+        except OSError:
             return []
-        
-        with open(sessions_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("sessions", [])
-    except (RuntimeError, json.JSONDecodeError, IOError):
+
+        if mtime == _SESSIONS_CACHE["mtime"]:
+            return _SESSIONS_CACHE["data"]
+
+        with open(sessions_file, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        sessions = data.get("sessions", [])
+        _SESSIONS_CACHE["mtime"] = mtime
+        _SESSIONS_CACHE["data"] = sessions
+        return sessions
+    except (RuntimeError, ValueError, IOError):
         # Outside application context or file read error, return empty list
         return []
 
@@ -32,7 +64,7 @@ def load_sessions() -> list[dict]:
 @pages_bp.get("/")
 def index():
     sessions = load_sessions()
-    return render_template("index.html", current_year=datetime.now().year, sessions=sessions)
+    return render_template("index.html", current_year=_current_year(), sessions=sessions)
 
 
 @pages_bp.get("/home")
@@ -77,11 +109,7 @@ def drafter():
                     session_data["paths"] = {}
                 
                 try:
-                    processed_drawing_url = url_for(
-                        "uploads.serve_uploaded_file",
-                        session_id=session_id,
-                        filename=filename,
-                    )
+                    processed_drawing_url = upload_file_url(session_id, filename)
                     session_data["paths"]["processed_drawing_url"] = processed_drawing_url
                     current_app.logger.info(
                         f"Added processed_drawing_url for session {session_id}: {processed_drawing_url} (filename: {filename}, processed_drawing: {session_data.get('processed_drawing')})"
@@ -97,7 +125,7 @@ def drafter():
     
     return render_template(
         "drafter.html",
-        current_year=datetime.now().year,
+        current_year=_current_year(),
         session_data=session_data,
     )
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Set, Tuple
+from urllib.parse import quote
 
-from flask import Blueprint, current_app, jsonify, request, send_from_directory, url_for
+from flask import Blueprint, current_app, g, jsonify, request, send_file
 
 from backend.app.container import get_document_service, get_session_service
 from backend.services.document_service import DocumentStorageError, UnsupportedDocumentError
@@ -10,21 +14,93 @@ from backend.services.session_service import SessionNotFoundError
 
 uploads_bp = Blueprint("uploads", __name__)
 
+# Directories already created by upload_document; lets the serve path (and
+# repeat uploads) skip the mkdir calls entirely.
+_CREATED_DIRS: Set[str] = set()
+
+# (session_id, filename) -> full path the file was found at. Filled lazily on
+# first serve, so repeat GETs skip the existence probes and go straight to
+# send_file.
+_UPLOAD_FILE_PATHS: Dict[Tuple[int, str], str] = {}
+
+
+@lru_cache(maxsize=1024)
+def _session_dirs(instance_path: str, catalog_name: str) -> Tuple[str, str]:
+    """Return (uploads_dir, processed_dir) strings for a session catalog.
+
+    ``Path.resolve()`` stats the filesystem and every join allocates a new
+    ``Path``; both inputs are invariant per session, so the result is cached.
+    Plain strings are kept throughout the serve path - ``os.path`` joins are
+    markedly cheaper than pathlib on a per-request basis.
+    """
+    session_dir = os.path.join(str(Path(instance_path).resolve()), "sessions_id_", catalog_name)
+    return os.path.join(session_dir, "uploads"), os.path.join(session_dir, "processed_drawing")
+
+
+def _ensure_session_dirs(upload_dir: str, processed_dir: str) -> None:
+    """Create the session's upload directories once per process."""
+    for directory in (upload_dir, processed_dir):
+        if directory not in _CREATED_DIRS:
+            os.makedirs(directory, exist_ok=True)
+            _CREATED_DIRS.add(directory)
+
+
+def _update_session_drawing(session_service, session_id: int, relative_path: str, logger) -> None:
+    """Persist the processed_drawing path; runs on the shared executor."""
+    try:
+        session_service.update_session(session_id=session_id, processed_drawing=relative_path)
+    except SessionNotFoundError:
+        # Session was deleted, continue anyway
+        logger.warning("Session %s was deleted after upload", session_id)
+    except Exception:
+        logger.error("Error updating session %s", session_id, exc_info=True)
+
+
+@uploads_bp.url_value_preprocessor
+def _resolve_session_dirs(endpoint, values):
+    """Resolve the session and its directories once per URL-bound request.
+
+    Routes with ``<int:session_id>`` in their rule get ``g.upload_session``
+    and ``g.upload_session_dirs`` populated here, so the view body does no
+    session lookup of its own.
+    """
+    if not values or "session_id" not in values:
+        return
+    try:
+        session = get_session_service().get_session(values["session_id"])
+    except SessionNotFoundError:
+        g.upload_session = None
+        return
+    g.upload_session = session
+    g.upload_session_dirs = _session_dirs(
+        current_app.instance_path, session["storage_catalog_name"]
+    )
+
+
+def upload_file_url(session_id: int, filename: str) -> str:
+    """URL for ``serve_uploaded_file`` built from its fixed rule pattern.
+
+    Equivalent to ``url_for("uploads.serve_uploaded_file", ...)`` but without
+    the URL-map walk and converter dispatch, which matters on the upload
+    response and drafter page where it is called per document.
+    """
+    return f"/uploads/{session_id}/{quote(filename, safe='/')}"
+
 
 @uploads_bp.post("/api/upload-document")
 def upload_document():
     """Upload document to a session directory. Session ID is required."""
-    file = request.files.get("document")
-    # Try to get session_id from multiple sources: URL params, FormData, or JSON body
-    session_id = None
-    
-    # Try URL parameters first
+    # Resolve session_id before touching request.files/request.form: clients
+    # are expected to pass ?session_id= on the upload URL, and the query
+    # string is available without parsing the (potentially large) multipart
+    # body. The form/JSON fallbacks below force a body parse and only run
+    # when the query parameter is absent.
     session_id = request.args.get("session_id", type=int)
-    
+
     # Try FormData if not found in URL
     if not session_id and request.form:
         session_id = request.form.get("session_id", type=int)
-    
+
     # Try JSON body if still not found
     if not session_id and request.is_json:
         json_session_id = request.json.get("session_id")
@@ -38,72 +114,55 @@ def upload_document():
     if not session_id:
         return jsonify({"message": "session_id is required"}), 400
 
+    file = request.files.get("document")
+
     document_service = get_document_service()
     
     try:
         session_service = get_session_service()
         session = session_service.get_session(session_id)
         
-        # Get session directory paths - use the same method as SessionService
-        # SessionService uses: instance_path / "sessions_id_" / catalog_name
-        # Ensure we use the same instance_path resolution as SessionService
-        instance_path = Path(current_app.instance_path).resolve()
-        catalog_name = session["storage_catalog_name"]
-        sessions_dir = instance_path / "sessions_id_"
-        session_dir = sessions_dir / catalog_name
-        
-        # Debug: verify instance_path is correct
-        current_app.logger.debug(f"Instance path: {instance_path}, exists: {instance_path.exists()}")
-        current_app.logger.debug(f"Session dir: {session_dir}")
-        
-        session_upload_dir = session_dir / "uploads"
-        session_processed_dir = session_dir / "processed_drawing"
-        
-        # Ensure directories exist
-        session_upload_dir.mkdir(parents=True, exist_ok=True)
-        session_processed_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Verify paths are correct (debug)
-        current_app.logger.debug(
-            f"Session upload dir: {session_upload_dir}, exists: {session_upload_dir.exists()}"
-        )
-        current_app.logger.debug(
-            f"Session processed dir: {session_processed_dir}, exists: {session_processed_dir.exists()}"
+        # Same layout as SessionService: instance_path / "sessions_id_" / catalog
+        session_upload_dir, session_processed_dir = _session_dirs(
+            current_app.instance_path, session["storage_catalog_name"]
         )
-        
+        _ensure_session_dirs(session_upload_dir, session_processed_dir)
+
     except SessionNotFoundError:
         return jsonify({"message": f"Session {session_id} not found"}), 404
-    except Exception as e:
-        current_app.logger.error(f"Error getting session directories: {e}", exc_info=True)
+    except Exception:
+        current_app.logger.error("Error getting session directories", exc_info=True)
         return jsonify({"message": "Internal server error"}), 500
 
     current_app.logger.info(
-        f"Uploading document for session {session_id} to {session_upload_dir}"
+        "Uploading document for session %s to %s", session_id, session_upload_dir
     )
 
     try:
+        # save_document works in Path terms; uploads are rare enough that the
+        # two conversions here don't matter, unlike the per-GET serve path.
         stored_document = document_service.save_document(
             file,
-            session_upload_dir=session_upload_dir,
-            session_processed_dir=session_processed_dir,
+            session_upload_dir=Path(session_upload_dir),
+            session_processed_dir=Path(session_processed_dir),
         )
     except UnsupportedDocumentError as exc:
         return jsonify({"message": str(exc)}), 400
     except DocumentStorageError as exc:
         return jsonify({"message": str(exc)}), 500
 
-    # Update session with processed_drawing path
+    # Update session with processed_drawing path. The file is already on disk
+    # and the response URLs are deterministic, so the metadata write runs on
+    # the shared executor instead of keeping the client waiting on another
+    # JSON flush.
     if stored_document.stored_relative_path:
-        try:
-            session_service.update_session(
-                session_id=session_id,
-                processed_drawing=stored_document.stored_relative_path,
-            )
-        except SessionNotFoundError:
-            # Session was deleted, continue anyway
-            current_app.logger.warning(f"Session {session_id} was deleted after upload")
-        except Exception as e:
-            current_app.logger.error(f"Error updating session {session_id}: {e}", exc_info=True)
+        current_app.extensions["executor"].submit(
+            _update_session_drawing,
+            session_service,
+            session_id,
+            stored_document.stored_relative_path,
+            current_app.logger,
+        )
 
     return (
         jsonify(
@@ -116,15 +175,9 @@ def upload_document():
                     "storedFilename": stored_document.stored_filename,
                     "storedRelativePath": stored_document.stored_relative_path,
                     "wasConverted": stored_document.was_converted,
-                    "imageUrl": url_for(
-                        "uploads.serve_uploaded_file",
-                        session_id=session_id,
-                        filename=stored_document.stored_filename,
-                    ),
-                    "originalUrl": url_for(
-                        "uploads.serve_uploaded_file",
-                        session_id=session_id,
-                        filename=stored_document.original_stored_filename,
+                    "imageUrl": upload_file_url(session_id, stored_document.stored_filename),
+                    "originalUrl": upload_file_url(
+                        session_id, stored_document.original_stored_filename
                     ),
                     "warnings": stored_document.warnings,
                     "imageWidth": stored_document.image_width,
@@ -141,30 +194,42 @@ def upload_document():
 def serve_uploaded_file(session_id: int, filename: str):
     """Serve uploaded file from session directory."""
     try:
-        session_service = get_session_service()
-        session = session_service.get_session(session_id)
-        
-        # Get session directory path
-        instance_path = Path(current_app.instance_path).resolve()
-        catalog_name = session["storage_catalog_name"]
-        sessions_dir = instance_path / "sessions_id_"
-        session_dir = sessions_dir / catalog_name
-        
-        # Try to find file in uploads or processed_drawing directories
-        uploads_dir = session_dir / "uploads"
-        processed_dir = session_dir / "processed_drawing"
-        
-        # Check in uploads first, then processed_drawing
-        if (uploads_dir / filename).exists():
-            return send_from_directory(uploads_dir, filename, as_attachment=False)
-        elif (processed_dir / filename).exists():
-            return send_from_directory(processed_dir, filename, as_attachment=False)
-        else:
+        if g.get("upload_session") is None:
+            return jsonify({"message": f"Session {session_id} not found"}), 404
+
+        # Resolved once by the url_value_preprocessor; no session lookup,
+        # resolve or mkdir on the serve path
+        uploads_dir, processed_dir = g.upload_session_dirs
+
+        # Check in uploads first, then processed_drawing; one isfile stat per
+        # candidate, and the hit is remembered for subsequent requests.
+        full_path = _UPLOAD_FILE_PATHS.get((session_id, filename))
+        if full_path is None:
+            for candidate in (uploads_dir, processed_dir):
+                path = os.path.normpath(os.path.join(candidate, filename))
+                # Traversal guard: send_from_directory used to do this check
+                if not path.startswith(candidate + os.sep):
+                    continue
+                if os.path.isfile(path):
+                    full_path = path
+                    _UPLOAD_FILE_PATHS[(session_id, filename)] = path
+                    break
+
+        if full_path is None:
             return jsonify({"message": f"File {filename} not found in session {session_id}"}), 404
+
+        # Stored filenames are unique per upload, so the content at a given
+        # URL never changes: let browsers cache it for a day and revalidate
+        # with the conditional ETag/Last-Modified pair after that.
+        response = send_file(full_path, conditional=True, max_age=86400)
+        response.headers["Cache-Control"] = "public, max-age=86400, immutable"
+        return response
             
     except SessionNotFoundError:
         return jsonify({"message": f"Session {session_id} not found"}), 404
-    except Exception as e:
-        current_app.logger.error(f"Error serving file {filename} for session {session_id}: {e}", exc_info=True)
+    except Exception:
+        current_app.logger.error(
+            "Error serving file %s for session %s", filename, session_id, exc_info=True
+        )
         return jsonify({"message": "Internal server error"}), 500
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 
 from backend.config import resolve_config
 from backend.extensions import init_extensions
 from backend.app.container import register_services
+from backend.app.json import HAS_ORJSON, OrjsonProvider
 
 
 def create_app(config_name: str | None = None) -> Flask:
@@ -24,11 +27,33 @@ def create_app(config_name: str | None = None) -> Flask:
 
     config_class = resolve_config(config_name or os.getenv("FLASK_ENV"))
     app.config.from_object(config_class)
+    if HAS_ORJSON:
+        app.json = OrjsonProvider(app)
+    # Flask 3 moved the old JSONIFY_PRETTYPRINT_REGULAR / JSON_SORT_KEYS
+    # config keys onto the provider. Compact, insertion-ordered output keeps
+    # geometry/session payloads free of O(N) indent bytes and per-dict key
+    # sorts, in debug mode included.
+    app.json.compact = True
+    app.json.sort_keys = False
     _ensure_instance_subdirs(app)
 
+    # Compiled templates persist across worker restarts, and without
+    # auto_reload the per-render source-mtime stat disappears in production.
+    jinja_cache_dir = Path(app.instance_path) / "jinja_cache"
+    jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=str(jinja_cache_dir))
+    if not app.debug:
+        app.jinja_env.auto_reload = False
+
     init_extensions(app)
     register_services(app)
     _register_blueprints(app)
+
+    # Shared worker pool for request handlers that want to finish disk I/O
+    # (e.g. session metadata writes after an upload) off the request thread.
+    app.extensions["executor"] = ThreadPoolExecutor(
+        max_workers=4, thread_name_prefix="app-io"
+    )
     return app
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from flask import current_app
+from werkzeug.local import LocalProxy
 
 from backend.services import DocumentService
 from backend.services.session_service import SessionService
@@ -24,30 +25,31 @@ def register_services(app) -> None:
         app.extensions[GEOMETRY_SERVICE_KEY] = geometry_service
 
 
+# The accessors below index extensions directly: create_app always runs
+# register_services, so the old "construct lazily if missing" branch was dead
+# code that still cost a dict .get plus None-check on every request. A
+# KeyError here means the app was built without the factory, which is a bug
+# worth surfacing loudly.
+
 def get_document_service() -> DocumentService:
     """Return the shared document service instance."""
-    service = current_app.extensions.get(DOCUMENT_SERVICE_KEY)
-    if service is None:
-        service = DocumentService.from_app_config()
-        current_app.extensions[DOCUMENT_SERVICE_KEY] = service
-    return service
+    return current_app.extensions[DOCUMENT_SERVICE_KEY]
 
 
 def get_session_service() -> SessionService:
     """Return the shared session service instance."""
-    service = current_app.extensions.get(SESSION_SERVICE_KEY)
-    if service is None:
-        service = SessionService.from_app_config()
-        current_app.extensions[SESSION_SERVICE_KEY] = service
-    return service
+    return current_app.extensions[SESSION_SERVICE_KEY]
 
 
 def get_geometry_service() -> GeometryService:
     """Return the shared geometry service instance."""
-    service = current_app.extensions.get(GEOMETRY_SERVICE_KEY)
-    if service is None:
-        session_service = get_session_service()
-        service = GeometryService(session_service)
-        current_app.extensions[GEOMETRY_SERVICE_KEY] = service
-    return service
+    return current_app.extensions[GEOMETRY_SERVICE_KEY]
+
+
+# Module-level handles for the shared services. Handlers can use these
+# directly instead of calling the get_* accessor on every request; the proxy
+# resolves against the active application the same way current_app does.
+document_service: DocumentService = LocalProxy(get_document_service)  # type: ignore[assignment]
+session_service: SessionService = LocalProxy(get_session_service)  # type: ignore[assignment]
+geometry_service: GeometryService = LocalProxy(get_geometry_service)  # type: ignore[assignment]
 
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+# OPT_SERIALIZE_NUMPY lets numpy scalars/arrays pass straight through if they
+# ever appear in a payload; OPT_NON_STR_KEYS matches stdlib json behaviour for
+# int-keyed dicts.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if HAS_ORJSON else 0
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # Delegate datetime/date/uuid/dataclass handling to Flask's default rules
+    return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    orjson encodes/decodes in native code, which is significantly faster than
+    the stdlib ``json`` module for the large geometry payloads served by
+    ``get_geometry``. ``jsonify`` and ``request.get_json`` both route through
+    the active provider, so installing this provider removes the pure-Python
+    encode/decode path application-wide.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode(
+            "utf-8"
+        )
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response from orjson's bytes output directly.
+
+        Overridden to skip the bytes -> str -> bytes round trip performed by
+        the default implementation.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -6,15 +6,100 @@ encapsulation and methods for converting to storage and frontend JSON formats.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
+from itertools import chain
+from typing import Dict, Any, Iterator, List, Optional, Union, TYPE_CHECKING
 from datetime import datetime
+import json
+import sys
 import uuid
 import math
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from backend.services.geometry_service import GeometryService
 
 
+def _dumps_bytes(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a dict, interning its string keys.
+
+    Style dicts repeat the same few keys across thousands of parcels;
+    interning collapses them to shared objects and lets later dict lookups
+    hit the pointer-equality fast path. Values stay as-is.
+    """
+    return {sys.intern(k): v for k, v in mapping.items()}
+
+
+def _id_or_new(data: Dict[str, Any]) -> str:
+    """Return data['id'] if present, else a fresh hex UUID.
+
+    dict.get with a default would generate (and discard) a UUID even when
+    the id is present - measurable when deserializing thousands of objects.
+    """
+    object_id = data.get('id')
+    return object_id if object_id else uuid.uuid4().hex
+
+
+# Degree/radian conversion as multiplications: math.radians/math.degrees are
+# function calls per use, the constants fold into the surrounding arithmetic.
+_RAD2DEG = 180.0 / math.pi
+_DEG2RAD = math.pi / 180.0
+
+
+def _line_recalc_kernel(sx: float, sy: float, ex: float, ey: float,
+                        azimuth_rad: float, distance: float,
+                        blocked_is_start: bool) -> tuple:
+    """
+    Pure numeric core of LineSegment.recalculate_by_bearing_and_distance.
+
+    Takes scalar floats only so it can be JIT-compiled when numba is
+    installed; without numba it still runs faster than the inline version
+    because the trig/branch sequence executes in one frame without property
+    round-trips. Returns (sx, sy, ex, ey, length, azimuth_degrees).
+    """
+    dx = distance * math.sin(azimuth_rad)  # East component
+    dy = distance * math.cos(azimuth_rad)  # North component
+
+    if blocked_is_start:
+        ex = sx + dx
+        ey = sy + dy
+    else:
+        sx = ex - dx
+        sy = ey - dy
+
+    dx_new = ex - sx
+    dy_new = ey - sy
+    length = math.hypot(dx_new, dy_new)
+
+    # atan2 gives angle from East; azimuth measures from North, clockwise
+    azimuth = (90.0 - math.atan2(dy_new, dx_new) * _RAD2DEG) % 360.0
+    return sx, sy, ex, ey, length, azimuth
+
+
+if njit is not None:
+    _line_recalc_kernel = njit(cache=True, fastmath=True)(_line_recalc_kernel)
+
+
 # ============================================================================
 # Utility functions for azimuth and bearing conversion
 # ============================================================================
@@ -67,6 +152,70 @@ def azimuth_to_bearing(azimuth: float) -> Dict[str, Any]:
     return {"quadrant": quadrant, "bearing": bearing}
 
 
+# Quadrant names indexed by int(azimuth // 90); shared by the batch converter.
+_QUADRANT_NAMES = ("NE", "SE", "SW", "NW")
+
+# Quadrant boundaries for the vectorized searchsorted classification.
+_QUADRANT_BOUNDS = np.array([90.0, 180.0, 270.0]) if np is not None else None
+
+# Interned segment-type strings: every Segment stores one of these two
+# values, so the stored attribute is a shared pointer rather than a fresh
+# copy per object, and equality checks against them resolve by identity.
+_LINE = sys.intern('line')
+_ARC = sys.intern('arc')
+_SEGMENT_TYPES = (_LINE, _ARC)
+
+# bearing -> azimuth per quadrant as (sign, offset): azimuth = offset + sign*bearing.
+# One hash lookup and two FLOPs instead of a four-way elif chain per call.
+# Upper/lower/title case variants all map to the same tuple, so the common
+# spellings dispatch without a per-call str.upper() allocation.
+_QUAD_LUT = {}
+for _quad, _entry in (
+    ("NE", (1.0, 0.0)),    # Axis N is 0°, axis E is 90°
+    ("SE", (-1.0, 180.0)),  # Axis S is 0°, axis E is 90°
+    ("SW", (1.0, 180.0)),  # Axis S is 0°, axis W is 90°
+    ("NW", (-1.0, 360.0)),  # Axis N is 0°, axis W is 90°
+):
+    for _variant in {_quad, _quad.lower(), _quad.title()}:
+        _QUAD_LUT[sys.intern(_variant)] = _entry
+del _quad, _entry, _variant
+
+
+def azimuth_to_bearing_batch(azimuths: List[float]) -> tuple:
+    """
+    Convert many azimuths to bearings in one pass.
+
+    Batch companion to azimuth_to_bearing: instead of one dict per call it
+    returns a structure-of-arrays pair (quadrants, bearings) of equal-length
+    lists. Vectorized with numpy when available; otherwise a single
+    LUT-driven Python loop, which still avoids the per-call dict allocation.
+    """
+    if np is not None:
+        az = np.mod(np.asarray(azimuths, dtype=np.float64), 360.0)
+        # Branchless quadrant classification: searchsorted is a C-level
+        # binary search over the three boundaries, applied across the array
+        q_idx = np.searchsorted(_QUADRANT_BOUNDS, az, side='right')
+        bearings = np.where(
+            q_idx == 0, az,
+            np.where(q_idx == 1, 180.0 - az,
+                     np.where(q_idx == 2, az - 180.0, 360.0 - az))
+        )
+        quadrants = [_QUADRANT_NAMES[i] for i in q_idx]
+        return quadrants, bearings.tolist()
+
+    quadrants = []
+    bearings = []
+    names = _QUADRANT_NAMES
+    for azimuth in azimuths:
+        azimuth = azimuth % 360
+        i = int(azimuth // 90)
+        quadrants.append(names[i])
+        # Even quadrants (NE, SW) measure from their axis forwards, odd ones
+        # (SE, NW) backwards; same mapping as the scalar function's branches.
+        bearings.append(azimuth - 90 * i if not i & 1 else 90 * (i + 1) - azimuth)
+    return quadrants, bearings
+
+
 def bearing_to_azimuth(quadrant: str, bearing: float) -> float:
     """
     Convert bearing (quadrant + angle) to azimuth (decimal degrees).
@@ -83,28 +232,16 @@ def bearing_to_azimuth(quadrant: str, bearing: float) -> float:
     """
     if bearing < 0 or bearing > 90:
         raise ValueError(f"Bearing must be in range 0-90 degrees, got {bearing}")
-    
-    quadrant = quadrant.upper()
-    
-    if quadrant == "NE":
-        # Axis N is 0°, axis E is 90°
-        azimuth = bearing
-    elif quadrant == "SE":
-        # Axis S is 0°, axis E is 90°
-        azimuth = 180 - bearing
-    elif quadrant == "SW":
-        # Axis S is 0°, axis W is 90°
-        azimuth = 180 + bearing
-    elif quadrant == "NW":
-        # Axis N is 0°, axis W is 90°
-        azimuth = 360 - bearing
-    else:
-        raise ValueError(f"Invalid quadrant: {quadrant}. Must be NE, NW, SW, or SE")
-    
-    # Normalize to 0-360 range
-    azimuth = azimuth % 360
-    
-    return azimuth
+
+    # The LUT carries the common case variants, so only oddball mixed-case
+    # spellings ("nE") fall back to the str.upper() allocation.
+    entry = _QUAD_LUT.get(quadrant) or _QUAD_LUT.get(quadrant.upper())
+    if entry is None:
+        raise ValueError(f"Invalid quadrant: {quadrant.upper()}. Must be NE, NW, SW, or SE")
+
+    sign, offset = entry
+    # Normalize to 0-360 range (NW with bearing 0 would otherwise yield 360)
+    return (offset + sign * bearing) % 360
 
 
 class GeometryObject(ABC):
@@ -114,11 +251,18 @@ class GeometryObject(ABC):
     Provides encapsulation of properties and methods for JSON serialization
     for both storage and frontend formats.
     """
-    
+
+    # Slotted throughout the hierarchy: a site holds thousands of small
+    # objects, and dropping the per-instance __dict__ roughly halves their
+    # footprint while making attribute access a fixed-offset read. Private
+    # names in __slots__ are mangled like any other class-body identifier,
+    # so each class lists its own.
+    __slots__ = ('__id', '__attributes', '__metadata', '__weakref__')
+
     def __init__(self, **kwargs):
         """Initialize geometry object with properties."""
         # Common properties stored privately
-        self.__id = kwargs.get('id', str(uuid.uuid4()))
+        self.__id = kwargs.get('id') or uuid.uuid4().hex
         self.__attributes = kwargs.get('attributes', {})
         self.__metadata = kwargs.get('metadata', {})
     
@@ -138,8 +282,13 @@ class GeometryObject(ABC):
     # Attributes property
     @property
     def attributes(self) -> Dict[str, Any]:
-        """Get attributes dictionary."""
-        return self.__attributes.copy()
+        """Get attributes dictionary (live reference; replace via the setter).
+
+        Returning the internal dict avoids a copy per access - serialization
+        walks these for every object on every save. The setter still copies,
+        so assigning a caller-owned dict never aliases internal state.
+        """
+        return self.__attributes
     
     @attributes.setter
     def attributes(self, value: Dict[str, Any]) -> None:
@@ -163,8 +312,8 @@ class GeometryObject(ABC):
     # Metadata property
     @property
     def metadata(self) -> Dict[str, Any]:
-        """Get metadata dictionary."""
-        return self.__metadata.copy()
+        """Get metadata dictionary (live reference; replace via the setter)."""
+        return self.__metadata
     
     @metadata.setter
     def metadata(self, value: Dict[str, Any]) -> None:
@@ -193,6 +342,17 @@ class GeometryObject(ABC):
         """
         pass
     
+    def to_json_bytes(self, frontend: bool = False) -> bytes:
+        """
+        Serialize this object straight to JSON bytes.
+
+        Uses orjson when available, which walks the dict tree in C instead
+        of building the byte string through Python-level json.dumps. Callers
+        that only need the encoded form should prefer this over serializing
+        the to_*_json() dict themselves.
+        """
+        return _dumps_bytes(self.to_frontend_json() if frontend else self.to_storage_json())
+
     @classmethod
     @abstractmethod
     def from_storage_json(cls, data: Dict[str, Any]) -> 'GeometryObject':
@@ -223,7 +383,9 @@ class GeometryObject(ABC):
 
 class Point(GeometryObject):
     """Represents a point in 2D space."""
-    
+
+    __slots__ = ('__x', '__y', '__layer')
+
     def __init__(self, x: float = 0.0, y: float = 0.0, **kwargs):
         super().__init__(**kwargs)
         self.__x = float(x)
@@ -284,7 +446,7 @@ class Point(GeometryObject):
     def from_storage_json(cls, data: Dict[str, Any]) -> 'Point':
         """Create Point from storage JSON."""
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             x=data.get('x', 0.0),
             y=data.get('y', 0.0),
             layer=data.get('layer', ''),
@@ -310,41 +472,89 @@ class Point(GeometryObject):
 
 class Segment(GeometryObject):
     """Base class for geometry segments (line or arc)."""
+
+    __slots__ = ('__segment_type', '__start_x', '__start_y',
+                 '__end_x', '__end_y', '__layer', '__length')
     
     def __init__(self, segment_type: str, start: Dict[str, float], end: Dict[str, float], **kwargs):
         super().__init__(**kwargs)
-        if segment_type not in ['line', 'arc']:
+        if segment_type not in _SEGMENT_TYPES:
             raise ValueError(f"Invalid segment type: {segment_type}. Must be 'line' or 'arc'")
-        self.__segment_type = segment_type
-        self.__start = {'x': float(start['x']), 'y': float(start['y'])}
-        self.__end = {'x': float(end['x']), 'y': float(end['y'])}
+        self.__segment_type = sys.intern(segment_type)
+        # Endpoints are stored as four flat floats rather than two {'x','y'}
+        # dicts: no per-endpoint dict overhead, and coordinate math reads
+        # scalars without hashed lookups. The dict form is built on demand at
+        # the JSON boundary.
+        self.__start_x = float(start['x'])
+        self.__start_y = float(start['y'])
+        self.__end_x = float(end['x'])
+        self.__end_y = float(end['y'])
         self.__layer = kwargs.get('layer', '')
         self.__length = kwargs.get('length', 0.0)
-    
+
     @property
     def segment_type(self) -> str:
         """Get segment type ('line' or 'arc')."""
         return self.__segment_type
-    
+
+    @property
+    def start_x(self) -> float:
+        """Get start point X coordinate."""
+        return self.__start_x
+
+    @property
+    def start_y(self) -> float:
+        """Get start point Y coordinate."""
+        return self.__start_y
+
+    @property
+    def end_x(self) -> float:
+        """Get end point X coordinate."""
+        return self.__end_x
+
+    @property
+    def end_y(self) -> float:
+        """Get end point Y coordinate."""
+        return self.__end_y
+
     @property
     def start(self) -> Dict[str, float]:
-        """Get start point coordinates."""
-        return self.__start.copy()
-    
+        """Get start point coordinates as a fresh {'x', 'y'} dict."""
+        return {'x': self.__start_x, 'y': self.__start_y}
+
     @start.setter
     def start(self, value: Dict[str, float]) -> None:
         """Set start point coordinates."""
-        self.__start = {'x': float(value['x']), 'y': float(value['y'])}
-    
+        self.__start_x = float(value['x'])
+        self.__start_y = float(value['y'])
+
     @property
     def end(self) -> Dict[str, float]:
-        """Get end point coordinates."""
-        return self.__end.copy()
-    
+        """Get end point coordinates as a fresh {'x', 'y'} dict."""
+        return {'x': self.__end_x, 'y': self.__end_y}
+
     @end.setter
     def end(self, value: Dict[str, float]) -> None:
         """Set end point coordinates."""
-        self.__end = {'x': float(value['x']), 'y': float(value['y'])}
+        self.__end_x = float(value['x'])
+        self.__end_y = float(value['y'])
+
+    def _set_start(self, x: float, y: float) -> None:
+        """Set start coordinates from scalars (internal fast path)."""
+        self.__start_x = x
+        self.__start_y = y
+
+    def _set_end(self, x: float, y: float) -> None:
+        """Set end coordinates from scalars (internal fast path)."""
+        self.__end_x = x
+        self.__end_y = y
+
+    def translate(self, dx: float, dy: float) -> None:
+        """Shift both endpoints by (dx, dy)."""
+        self.__start_x += dx
+        self.__start_y += dy
+        self.__end_x += dx
+        self.__end_y += dy
     
     @property
     def layer(self) -> str:
@@ -371,8 +581,8 @@ class Segment(GeometryObject):
         result = {
             'id': self.id,
             'segmentType': self.__segment_type,
-            'start': self.__start.copy(),
-            'end': self.__end.copy(),
+            'start': {'x': self.__start_x, 'y': self.__start_y},
+            'end': {'x': self.__end_x, 'y': self.__end_y},
             'length': self.__length,
             'layer': self.__layer,
             'attributes': self.attributes
@@ -401,18 +611,9 @@ class Segment(GeometryObject):
     
     def delete(self, session_id: int, geometry_service: 'GeometryService', site: 'Site') -> 'Site':
         """Delete this segment and trigger re-save."""
-        # Find and remove segment from geometry
-        removed = False
-        for layer in site.geometry_layers:
-            for parcel in layer.parcels:
-                if parcel.geometry:
-                    if parcel.geometry.remove_segment(self.id):
-                        removed = True
-                        break
-            if removed:
-                break
-        
-        if not removed:
+        # Owner lookup and removal go through the site's segment index
+        # instead of scanning every layer/parcel geometry
+        if not site.remove_segment(self.id):
             raise ValueError(f"Segment with id {self.id} not found in site")
         
         # Save with versioning
@@ -425,8 +626,10 @@ class Segment(GeometryObject):
 
 class LineSegment(Segment):
     """Represents a line segment."""
-    
-    def __init__(self, start: Dict[str, float], end: Dict[str, float], 
+
+    __slots__ = ('__azimuth',)
+
+    def __init__(self, start: Dict[str, float], end: Dict[str, float],
                  bearing: float = 0.0, **kwargs):
         super().__init__('line', start, end, **kwargs)
         # Store as azimuth (direction to North 0°, clockwise up to 360°)
@@ -486,55 +689,30 @@ class LineSegment(Segment):
         
         # Convert bearing to azimuth using utility function
         azimuth = bearing_to_azimuth(quadrant, bearing)
-        
-        # Convert azimuth to radians for calculation
-        azimuth_rad = math.radians(azimuth)
-        
-        # Calculate the new point position
-        # Azimuth: 0° = North (positive Y), 90° = East (positive X), clockwise
-        dx = distance * math.sin(azimuth_rad)  # East component
-        dy = distance * math.cos(azimuth_rad)  # North component
-        
-        # Determine which point is blocked and calculate the other
-        # Use properties to access coordinates (avoids name mangling issues)
-        current_start = self.start
-        current_end = self.end
-        
+
+        # All the trig and coordinate arithmetic happens in the scalar kernel
+        # (JIT-compiled when numba is installed); endpoints are read and
+        # written as flat scalars, no dict packing on either side.
+        new_sx, new_sy, new_ex, new_ey, length, new_azimuth = _line_recalc_kernel(
+            self.start_x, self.start_y,
+            self.end_x, self.end_y,
+            azimuth * _DEG2RAD, distance,
+            blocked_point == "start_pt"
+        )
+
         if blocked_point == "start_pt":
-            # Keep start point, calculate new end point
-            new_end_x = current_start['x'] + dx
-            new_end_y = current_start['y'] + dy
             # Validate calculated coordinates are finite
-            if not (math.isfinite(new_end_x) and math.isfinite(new_end_y)):
-                raise ValueError(f"Calculated end point coordinates are not finite: ({new_end_x}, {new_end_y})")
-            self.end = {'x': new_end_x, 'y': new_end_y}
+            if not (math.isfinite(new_ex) and math.isfinite(new_ey)):
+                raise ValueError(f"Calculated end point coordinates are not finite: ({new_ex}, {new_ey})")
+            self._set_end(new_ex, new_ey)
         else:
-            # Keep end point, calculate new start point
-            new_start_x = current_end['x'] - dx
-            new_start_y = current_end['y'] - dy
             # Validate calculated coordinates are finite
-            if not (math.isfinite(new_start_x) and math.isfinite(new_start_y)):
-                raise ValueError(f"Calculated start point coordinates are not finite: ({new_start_x}, {new_start_y})")
-            self.start = {'x': new_start_x, 'y': new_start_y}
-        
-        # Recalculate length and azimuth using updated coordinates
-        updated_start = self.start
-        updated_end = self.end
-        dx_new = updated_end['x'] - updated_start['x']
-        dy_new = updated_end['y'] - updated_start['y']
-        self.length = float((dx_new ** 2 + dy_new ** 2) ** 0.5)
-        
-        # Recalculate azimuth from new coordinates
-        # atan2 gives angle from East, convert to azimuth (from North, clockwise)
-        angle_rad = math.atan2(dy_new, dx_new)
-        angle_deg = math.degrees(angle_rad)
-        # Convert from mathematical angle (0°=East) to azimuth (0°=North, clockwise)
-        # Mathematical: 0°=East, 90°=North, 180°=West, 270°=South
-        # Azimuth: 0°=North, 90°=East, 180°=South, 270°=West
-        # Formula: azimuth = (90 - angle_deg) % 360
-        # Python's % operator always returns a value in [0, 360) for positive modulus
-        azimuth = (90 - angle_deg) % 360
-        self.__azimuth = azimuth
+            if not (math.isfinite(new_sx) and math.isfinite(new_sy)):
+                raise ValueError(f"Calculated start point coordinates are not finite: ({new_sx}, {new_sy})")
+            self._set_start(new_sx, new_sy)
+
+        self.length = float(length)
+        self.__azimuth = new_azimuth
     
     def to_storage_json(self) -> Dict[str, Any]:
         """Convert to storage JSON format."""
@@ -551,7 +729,7 @@ class LineSegment(Segment):
     def from_storage_json(cls, data: Dict[str, Any]) -> 'LineSegment':
         """Create LineSegment from storage JSON."""
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             start=data.get('start', {'x': 0.0, 'y': 0.0}),
             end=data.get('end', {'x': 0.0, 'y': 0.0}),
             bearing=data.get('bearing', 0.0),  # Will be stored as azimuth internally
@@ -568,27 +746,48 @@ class LineSegment(Segment):
 
 class ArcSegment(Segment):
     """Represents an arc segment."""
-    
+
+    __slots__ = ('__center_x', '__center_y', '__radius', '__rotation', '__delta')
+
     def __init__(self, start: Dict[str, float], end: Dict[str, float],
                  center: Dict[str, float], radius: float,
                  rotation: str = 'cw', delta: Optional[float] = None, **kwargs):
         super().__init__('arc', start, end, **kwargs)
-        self.__center = {'x': float(center['x']), 'y': float(center['y'])}
+        # Flat floats, same layout rationale as Segment endpoints
+        self.__center_x = float(center['x'])
+        self.__center_y = float(center['y'])
         self.__radius = float(radius)
         if rotation not in ['cw', 'ccw']:
             raise ValueError(f"Invalid rotation: {rotation}. Must be 'cw' or 'ccw'")
         self.__rotation = rotation
         self.__delta = float(delta) if delta is not None else None
-    
+
+    @property
+    def center_x(self) -> float:
+        """Get center point X coordinate."""
+        return self.__center_x
+
+    @property
+    def center_y(self) -> float:
+        """Get center point Y coordinate."""
+        return self.__center_y
+
     @property
     def center(self) -> Dict[str, float]:
-        """Get center point coordinates."""
-        return self.__center.copy()
-    
+        """Get center point coordinates as a fresh {'x', 'y'} dict."""
+        return {'x': self.__center_x, 'y': self.__center_y}
+
     @center.setter
     def center(self, value: Dict[str, float]) -> None:
         """Set center point coordinates."""
-        self.__center = {'x': float(value['x']), 'y': float(value['y'])}
+        self.__center_x = float(value['x'])
+        self.__center_y = float(value['y'])
+
+    def translate(self, dx: float, dy: float) -> None:
+        """Shift endpoints and arc center by (dx, dy)."""
+        super().translate(dx, dy)
+        self.__center_x += dx
+        self.__center_y += dy
     
     @property
     def radius(self) -> float:
@@ -625,7 +824,7 @@ class ArcSegment(Segment):
     def to_storage_json(self) -> Dict[str, Any]:
         """Convert to storage JSON format."""
         result = super().to_storage_json()
-        result['center'] = self.__center.copy()
+        result['center'] = {'x': self.__center_x, 'y': self.__center_y}
         result['radius'] = self.__radius
         result['rot'] = self.__rotation  # Storage uses 'rot'
         if self.__delta is not None:
@@ -635,7 +834,7 @@ class ArcSegment(Segment):
     def to_frontend_json(self) -> Dict[str, Any]:
         """Convert to frontend JSON format."""
         result = super().to_storage_json()
-        result['center'] = self.__center.copy()
+        result['center'] = {'x': self.__center_x, 'y': self.__center_y}
         result['radius'] = self.__radius
         result['rotation'] = self.__rotation  # Frontend uses 'rotation'
         if self.__delta is not None:
@@ -648,7 +847,7 @@ class ArcSegment(Segment):
         # Handle both 'rot' and 'rotation' keys
         rotation = data.get('rot') or data.get('rotation', 'cw')
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             start=data.get('start', {'x': 0.0, 'y': 0.0}),
             end=data.get('end', {'x': 0.0, 'y': 0.0}),
             center=data.get('center', {'x': 0.0, 'y': 0.0}),
@@ -668,12 +867,18 @@ class ArcSegment(Segment):
 
 class Geometry(GeometryObject):
     """Represents a geometry object containing segments."""
-    
+
+    __slots__ = ('__type', '__is_closed', '__segments', '__by_id')
+
     def __init__(self, geometry_type: str = 'Polygon', is_closed: bool = True, **kwargs):
         super().__init__(**kwargs)
         self.__type = geometry_type
         self.__is_closed = is_closed
         self.__segments: List[Segment] = []
+        # id -> Segment side index for O(1) lookup/removal checks; the list
+        # stays authoritative for ordering (segments form connected paths,
+        # so swap-remove tricks that disturb order are not an option).
+        self.__by_id: Dict[str, Segment] = {}
     
     @property
     def type(self) -> str:
@@ -697,30 +902,72 @@ class Geometry(GeometryObject):
     
     @property
     def segments(self) -> List[Segment]:
-        """Get list of segments (read-only copy)."""
-        return self.__segments.copy()
+        """Get list of segments (live reference; mutate via add/remove_segment)."""
+        return self.__segments
     
     def add_segment(self, segment: Segment) -> None:
         """Add a segment to the geometry."""
         if not isinstance(segment, Segment):
             raise TypeError("segment must be an instance of Segment")
         self.__segments.append(segment)
-    
+        self.__by_id[segment.id] = segment
+
+    def _add_segment_unchecked(self, segment: Segment) -> None:
+        """Append a known-good Segment; deserializer fast path, no type check."""
+        self.__segments.append(segment)
+        self.__by_id[segment.id] = segment
+
+    def _extend_segments_unchecked(self, segments: List[Segment]) -> None:
+        """Bulk-append known-good Segments: one list.extend plus one dict pass."""
+        self.__segments.extend(segments)
+        by_id = self.__by_id
+        for segment in segments:
+            by_id[segment.id] = segment
+
     def remove_segment(self, segment_id: str) -> bool:
         """Remove a segment by ID. Returns True if removed."""
-        for i, seg in enumerate(self.__segments):
-            if seg.id == segment_id:
-                self.__segments.pop(i)
-                return True
-        return False
-    
+        segment = self.__by_id.pop(segment_id, None)
+        if segment is None:
+            return False
+        self.__segments.remove(segment)
+        return True
+
     def get_segment(self, segment_id: str) -> Optional[Segment]:
         """Get a segment by ID."""
+        return self.__by_id.get(segment_id)
+
+    # Bulk operations. These run one pass over the flat scalar endpoints so
+    # site-wide math never materializes per-segment coordinate dicts.
+
+    def bbox(self) -> Optional[tuple]:
+        """Return (min_x, min_y, max_x, max_y) over all endpoints, or None."""
+        if not self.__segments:
+            return None
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
         for seg in self.__segments:
-            if seg.id == segment_id:
-                return seg
-        return None
-    
+            sx, sy, ex, ey = seg.start_x, seg.start_y, seg.end_x, seg.end_y
+            lo_x, hi_x = (sx, ex) if sx <= ex else (ex, sx)
+            lo_y, hi_y = (sy, ey) if sy <= ey else (ey, sy)
+            if lo_x < min_x:
+                min_x = lo_x
+            if hi_x > max_x:
+                max_x = hi_x
+            if lo_y < min_y:
+                min_y = lo_y
+            if hi_y > max_y:
+                max_y = hi_y
+        return min_x, min_y, max_x, max_y
+
+    def total_length(self) -> float:
+        """Return the summed length of all segments."""
+        return sum(seg.length for seg in self.__segments)
+
+    def bulk_translate(self, dx: float, dy: float) -> None:
+        """Shift every segment (endpoints and arc centers) by (dx, dy)."""
+        for seg in self.__segments:
+            seg.translate(dx, dy)
+
     def to_storage_json(self) -> Dict[str, Any]:
         """Convert to storage JSON format."""
         return {
@@ -743,14 +990,17 @@ class Geometry(GeometryObject):
     def from_storage_json(cls, data: Dict[str, Any]) -> 'Geometry':
         """Create Geometry from storage JSON."""
         geometry = cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             geometry_type=data.get('type', 'Polygon'),
             is_closed=data.get('isClosed', True),
             attributes=data.get('attributes', {})
         )
+        # Bind the hot names once; the loop can run thousands of times on a
+        # large site and each iteration otherwise pays two global lookups
+        from_storage = Segment.from_storage_json
+        add_segment = geometry._add_segment_unchecked
         for seg_data in data.get('segments', []):
-            segment = Segment.from_storage_json(seg_data)
-            geometry.add_segment(segment)
+            add_segment(from_storage(seg_data))
         return geometry
     
     @classmethod
@@ -784,15 +1034,21 @@ class Geometry(GeometryObject):
 
 class Parcel(GeometryObject):
     """Represents a parcel (property/feature)."""
-    
+
+    __slots__ = ('__name', '__feature_type', '__number', '__area',
+                 '__geometry', '__style')
+
     def __init__(self, name: str, feature_type: str = 'parcel', **kwargs):
         super().__init__(**kwargs)
         self.__name = name
-        self.__feature_type = feature_type
+        # Interned: thousands of parcels share the same handful of feature
+        # types, so the attribute is one shared string per distinct value
+        self.__feature_type = sys.intern(str(feature_type))
         self.__number = kwargs.get('number', 0)
         self.__area = kwargs.get('area', 0.0)
         self.__geometry: Optional[Geometry] = kwargs.get('geometry')
-        self.__style = kwargs.get('style', {})
+        style = kwargs.get('style')
+        self.__style = _intern_keys(style) if style else {}
     
     @property
     def name(self) -> str:
@@ -812,7 +1068,7 @@ class Parcel(GeometryObject):
     @feature_type.setter
     def feature_type(self, value: str) -> None:
         """Set feature type."""
-        self.__feature_type = str(value)
+        self.__feature_type = sys.intern(str(value))
     
     @property
     def number(self) -> int:
@@ -848,15 +1104,15 @@ class Parcel(GeometryObject):
     
     @property
     def style(self) -> Dict[str, Any]:
-        """Get style dictionary (for frontend display)."""
-        return self.__style.copy()
+        """Get style dictionary (live reference; replace via the setter)."""
+        return self.__style
     
     @style.setter
     def style(self, value: Dict[str, Any]) -> None:
         """Set style dictionary."""
         if not isinstance(value, dict):
             raise TypeError("style must be a dictionary")
-        self.__style = value.copy()
+        self.__style = _intern_keys(value)
     
     def to_storage_json(self) -> Dict[str, Any]:
         """Convert to storage JSON format (without style)."""
@@ -878,7 +1134,7 @@ class Parcel(GeometryObject):
             'name': self.__name,
             'featureType': self.__feature_type,
             'attributes': self.attributes,
-            'style': self.__style.copy()
+            'style': self.__style
         }
         if self.__geometry:
             result['geometry'] = self.__geometry.to_frontend_json()
@@ -892,7 +1148,7 @@ class Parcel(GeometryObject):
             geometry = Geometry.from_storage_json(data['geometry'])
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             name=data.get('name', ''),
             number=data.get('number', 0),
             area=data.get('area', 0.0),
@@ -908,7 +1164,7 @@ class Parcel(GeometryObject):
             geometry = Geometry.from_frontend_json(data['geometry'])
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             name=data.get('name', ''),
             feature_type=data.get('featureType', 'parcel'),
             area=data.get('attributes', {}).get('area', 0.0),
@@ -939,14 +1195,21 @@ class Parcel(GeometryObject):
 
 class GeometryLayer(GeometryObject):
     """Represents a geometry layer (collection of parcels/features)."""
-    
+
+    __slots__ = ('__layer_type', '__name', '__title', '__visible',
+                 '__parcels', '__by_id')
+
     def __init__(self, layer_type: str = 'Boundary', name: str = '', **kwargs):
         super().__init__(**kwargs)
-        self.__layer_type = layer_type
+        # Interned for the same reason as Parcel.feature_type: a handful of
+        # distinct values shared across every layer ever loaded
+        self.__layer_type = sys.intern(str(layer_type))
         self.__name = name
         self.__title = kwargs.get('title', name)
         self.__visible = kwargs.get('visible', True)
         self.__parcels: List[Parcel] = []
+        # id -> parcel for O(1) lookup; __parcels keeps insertion order
+        self.__by_id: Dict[str, Parcel] = {}
     
     @property
     def layer_type(self) -> str:
@@ -956,7 +1219,7 @@ class GeometryLayer(GeometryObject):
     @layer_type.setter
     def layer_type(self, value: str) -> None:
         """Set layer type."""
-        self.__layer_type = str(value)
+        self.__layer_type = sys.intern(str(value))
     
     @property
     def name(self) -> str:
@@ -990,29 +1253,32 @@ class GeometryLayer(GeometryObject):
     
     @property
     def parcels(self) -> List[Parcel]:
-        """Get list of parcels (read-only copy)."""
-        return self.__parcels.copy()
+        """Get list of parcels (live reference; mutate via add/remove_parcel)."""
+        return self.__parcels
     
     def add_parcel(self, parcel: Parcel) -> None:
         """Add a parcel to the layer."""
         if not isinstance(parcel, Parcel):
             raise TypeError("parcel must be an instance of Parcel")
         self.__parcels.append(parcel)
-    
+        self.__by_id[parcel.id] = parcel
+
+    def _add_parcel_unchecked(self, parcel: Parcel) -> None:
+        """Append a known-good Parcel; deserializer fast path, no type check."""
+        self.__parcels.append(parcel)
+        self.__by_id[parcel.id] = parcel
+
     def remove_parcel(self, parcel_id: str) -> bool:
         """Remove a parcel by ID. Returns True if removed."""
-        for i, parcel in enumerate(self.__parcels):
-            if parcel.id == parcel_id:
-                self.__parcels.pop(i)
-                return True
-        return False
-    
+        parcel = self.__by_id.pop(parcel_id, None)
+        if parcel is None:
+            return False
+        self.__parcels.remove(parcel)
+        return True
+
     def get_parcel(self, parcel_id: str) -> Optional[Parcel]:
         """Get a parcel by ID."""
-        for parcel in self.__parcels:
-            if parcel.id == parcel_id:
-                return parcel
-        return None
+        return self.__by_id.get(parcel_id)
     
     def to_storage_json(self) -> Dict[str, Any]:
         """Convert to storage JSON format."""
@@ -1038,31 +1304,33 @@ class GeometryLayer(GeometryObject):
     def from_storage_json(cls, data: Dict[str, Any]) -> 'GeometryLayer':
         """Create GeometryLayer from storage JSON."""
         layer = cls(
-            id=data.get('geometryLayerId', str(uuid.uuid4())),
+            id=data.get('geometryLayerId') or uuid.uuid4().hex,
             layer_type=data.get('geometryLayerType', 'Boundary'),
             name=data.get('name', ''),
             visible=data.get('visible', True),
             attributes=data.get('attributes', {})
         )
+        parcel_from_storage = Parcel.from_storage_json
+        add_parcel = layer._add_parcel_unchecked
         for parcel_data in data.get('parcels', []):
-            parcel = Parcel.from_storage_json(parcel_data)
-            layer.add_parcel(parcel)
+            add_parcel(parcel_from_storage(parcel_data))
         return layer
     
     @classmethod
     def from_frontend_json(cls, data: Dict[str, Any]) -> 'GeometryLayer':
         """Create GeometryLayer from frontend JSON."""
         layer = cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=_id_or_new(data),
             layer_type=data.get('layerType', 'Boundary'),
             name=data.get('name', ''),
             title=data.get('title', ''),
             visible=data.get('visible', True),
             attributes=data.get('attributes', {})
         )
+        parcel_from_frontend = Parcel.from_frontend_json
+        add_parcel = layer._add_parcel_unchecked
         for feature_data in data.get('features', []):
-            parcel = Parcel.from_frontend_json(feature_data)
-            layer.add_parcel(parcel)
+            add_parcel(parcel_from_frontend(feature_data))
         return layer
     
     def delete(self, session_id: int, geometry_service: 'GeometryService', site: 'Site') -> 'Site':
@@ -1080,7 +1348,11 @@ class GeometryLayer(GeometryObject):
 
 class Site(GeometryObject):
     """Represents a site containing geometry layers."""
-    
+
+    __slots__ = ('__project_id', '__name', '__version', '__history',
+                 '__geometry_layers', '__layers_by_id', '__segment_index',
+                 '__metadata', '__points', '__points_by_id', '__session_id')
+
     def __init__(self, project_id: str = '', site_id: Optional[str] = None, name: str = '', **kwargs):
         super().__init__(**kwargs)
         self.__project_id = project_id
@@ -1093,9 +1365,15 @@ class Site(GeometryObject):
             'previousVersionFile': None
         })
         self.__geometry_layers: List[GeometryLayer] = []
+        # id -> object maps for O(1) lookup; the lists keep insertion order
+        self.__layers_by_id: Dict[str, GeometryLayer] = {}
+        # segment id -> owning Geometry, built lazily on first lookup so
+        # per-segment operations don't rescan every layer/parcel
+        self.__segment_index: Optional[Dict[str, 'Geometry']] = None
         self.__metadata = kwargs.get('metadata', {})
         # For session-based geometry: store points and segments directly
         self.__points: List[Point] = []
+        self.__points_by_id: Dict[str, Point] = {}
         self.__session_id = kwargs.get('sessionId')
     
     @property
@@ -1140,8 +1418,8 @@ class Site(GeometryObject):
     
     @property
     def history(self) -> Dict[str, Any]:
-        """Get history dictionary."""
-        return self.__history.copy()
+        """Get history dictionary (live reference; replace via the setter)."""
+        return self.__history
     
     @history.setter
     def history(self, value: Dict[str, Any]) -> None:
@@ -1150,29 +1428,34 @@ class Site(GeometryObject):
     
     @property
     def geometry_layers(self) -> List[GeometryLayer]:
-        """Get list of geometry layers (read-only copy)."""
-        return self.__geometry_layers.copy()
+        """Get list of geometry layers (live reference; mutate via add/remove_geometry_layer)."""
+        return self.__geometry_layers
     
     def add_geometry_layer(self, layer: GeometryLayer) -> None:
         """Add a geometry layer to the site."""
         if not isinstance(layer, GeometryLayer):
             raise TypeError("layer must be an instance of GeometryLayer")
         self.__geometry_layers.append(layer)
-    
+        self.__layers_by_id[layer.id] = layer
+
+    def _add_geometry_layer_unchecked(self, layer: GeometryLayer) -> None:
+        """Append a known-good GeometryLayer; deserializer fast path, no type check."""
+        self.__geometry_layers.append(layer)
+        self.__layers_by_id[layer.id] = layer
+
     def remove_geometry_layer(self, layer_id: str) -> bool:
         """Remove a geometry layer by ID. Returns True if removed."""
-        for i, layer in enumerate(self.__geometry_layers):
-            if layer.id == layer_id:
-                self.__geometry_layers.pop(i)
-                return True
-        return False
-    
+        layer = self.__layers_by_id.pop(layer_id, None)
+        if layer is None:
+            return False
+        self.__geometry_layers.remove(layer)
+        # The removed layer's segments are gone with it
+        self.__segment_index = None
+        return True
+
     def get_geometry_layer(self, layer_id: str) -> Optional[GeometryLayer]:
         """Get a geometry layer by ID."""
-        for layer in self.__geometry_layers:
-            if layer.id == layer_id:
-                return layer
-        return None
+        return self.__layers_by_id.get(layer_id)
     
     # Session-based geometry support (for backward compatibility)
     @property
@@ -1187,49 +1470,89 @@ class Site(GeometryObject):
     
     @property
     def points(self) -> List[Point]:
-        """Get list of points (for session-based geometry)."""
-        return self.__points.copy()
+        """Get list of points (live reference; mutate via add/remove_point)."""
+        return self.__points
     
     def add_point(self, point: Point) -> None:
         """Add a point to the site (for session-based geometry)."""
         if not isinstance(point, Point):
             raise TypeError("point must be an instance of Point")
         self.__points.append(point)
-    
+        self.__points_by_id[point.id] = point
+
+    def _add_point_unchecked(self, point: Point) -> None:
+        """Append a known-good Point; deserializer fast path, no type check."""
+        self.__points.append(point)
+        self.__points_by_id[point.id] = point
+
     def remove_point(self, point_id: str) -> bool:
         """Remove a point by ID. Returns True if removed."""
-        for i, point in enumerate(self.__points):
-            if point.id == point_id:
-                self.__points.pop(i)
-                return True
-        return False
-    
+        point = self.__points_by_id.pop(point_id, None)
+        if point is None:
+            return False
+        self.__points.remove(point)
+        return True
+
     def get_point(self, point_id: str) -> Optional[Point]:
         """Get a point by ID."""
-        for point in self.__points:
-            if point.id == point_id:
-                return point
-        return None
+        return self.__points_by_id.get(point_id)
     
     def get_all_segments(self) -> List[Segment]:
         """Get all segments from all geometry layers and session-based segments."""
-        segments = []
-        # Get segments from geometry layers
+        # One C-level list build over chained iterators instead of growing
+        # the result with an extend call per parcel
+        return list(chain.from_iterable(
+            parcel.geometry.segments
+            for layer in self.__geometry_layers
+            for parcel in layer.parcels
+            if parcel.geometry
+        ))
+
+    def _iter_segments(self) -> Iterator[Segment]:
+        """Iterate all segments across layers without materializing a list."""
         for layer in self.__geometry_layers:
             for parcel in layer.parcels:
                 if parcel.geometry:
-                    segments.extend(parcel.geometry.segments)
-        return segments
+                    yield from parcel.geometry.segments
     
     def get_segment_by_id(self, segment_id: str) -> Optional[Segment]:
         """Find a segment by ID across all geometry layers."""
+        geometry = self._owning_geometry(segment_id)
+        return geometry.get_segment(segment_id) if geometry else None
+
+    def remove_segment(self, segment_id: str) -> bool:
+        """Remove a segment from its owning geometry. Returns True if removed."""
+        geometry = self._owning_geometry(segment_id)
+        if geometry is None or not geometry.remove_segment(segment_id):
+            return False
+        if self.__segment_index is not None:
+            self.__segment_index.pop(segment_id, None)
+        return True
+
+    def _owning_geometry(self, segment_id: str) -> Optional['Geometry']:
+        """Resolve the Geometry that holds segment_id via the reverse index.
+
+        Segments can be appended to a Geometry without the site seeing it,
+        so a miss triggers one rebuild before being reported as genuine.
+        """
+        index = self.__segment_index
+        if index is None:
+            index = self._build_segment_index()
+        geometry = index.get(segment_id)
+        if geometry is None:
+            geometry = self._build_segment_index().get(segment_id)
+        return geometry
+
+    def _build_segment_index(self) -> Dict[str, 'Geometry']:
+        """Rebuild the segment id -> owning Geometry map from scratch."""
+        index: Dict[str, 'Geometry'] = {}
         for layer in self.__geometry_layers:
             for parcel in layer.parcels:
                 if parcel.geometry:
-                    segment = parcel.geometry.get_segment(segment_id)
-                    if segment:
-                        return segment
-        return None
+                    for segment in parcel.geometry.segments:
+                        index[segment.id] = parcel.geometry
+        self.__segment_index = index
+        return index
     
     def to_storage_json(self) -> Dict[str, Any]:
         """Convert to storage JSON format."""
@@ -1238,7 +1561,7 @@ class Site(GeometryObject):
             'siteId': self.id,
             'name': self.__name,
             'version': self.__version,
-            'history': self.__history.copy(),
+            'history': self.__history,
             'geometryLayers': [layer.to_storage_json() for layer in self.__geometry_layers],
             'metadata': self.__metadata,
             'attributes': self.attributes
@@ -1247,13 +1570,9 @@ class Site(GeometryObject):
         if self.__session_id is not None:
             result['sessionId'] = self.__session_id
             result['points'] = [point.to_storage_json() for point in self.__points]
-            # Extract segments from geometry layers for session-based format
-            segments = []
-            for layer in self.__geometry_layers:
-                for parcel in layer.parcels:
-                    if parcel.geometry:
-                        segments.extend([seg.to_storage_json() for seg in parcel.geometry.segments])
-            result['segments'] = segments
+            # Extract segments from geometry layers for session-based format;
+            # single comprehension, no per-parcel intermediate lists
+            result['segments'] = [seg.to_storage_json() for seg in self._iter_segments()]
         return result
     
     def to_frontend_json(self) -> Dict[str, Any]:
@@ -1267,20 +1586,114 @@ class Site(GeometryObject):
         # Always include points and segments arrays for session-based geometry
         result['points'] = [point.to_frontend_json() for point in self.__points]
         # Extract segments from geometry layers
-        segments = []
+        result['segments'] = [seg.to_frontend_json() for seg in self._iter_segments()]
+        return result
+
+    def to_columnar_json(self) -> Dict[str, Any]:
+        """
+        Convert to a column-major (structure-of-arrays) frontend format.
+
+        Points are emitted as parallel ids/xs/ys/layers arrays instead of one
+        dict per point, so the payload repeats no keys and flat float arrays
+        serialize much faster. Segments keep their frontend dict form.
+        """
+        ids: List[str] = []
+        xs: List[float] = []
+        ys: List[float] = []
+        layers: List[str] = []
+        for point in self.__points:
+            ids.append(point.id)
+            xs.append(point.x)
+            ys.append(point.y)
+            layers.append(point.layer)
+
+        segments = [seg.to_frontend_json() for seg in self._iter_segments()]
+
+        return {
+            'metadata': self.__metadata if self.__metadata else {},
+            'attributes': self.attributes,
+            'format': 'columnar',
+            'ids': ids,
+            'xs': xs,
+            'ys': ys,
+            'layers': layers,
+            'segments': segments
+        }
+
+    def iter_frontend_chunks(self) -> Iterator[bytes]:
+        """
+        Yield the frontend JSON encoding as a stream of byte chunks.
+
+        Produces the same document as to_frontend_json(), but encodes each
+        layer/point/segment independently so the full payload never has to be
+        materialized as one dict plus one byte string. Intended for streaming
+        HTTP responses on large sites.
+        """
+        yield b'{"metadata":'
+        yield _dumps_bytes(self.__metadata if self.__metadata else {})
+        yield b',"collections":['
+        for i, layer in enumerate(self.__geometry_layers):
+            if i:
+                yield b','
+            yield _dumps_bytes(layer.to_frontend_json())
+        yield b'],"attributes":'
+        yield _dumps_bytes(self.attributes)
+        yield b',"points":['
+        for i, point in enumerate(self.__points):
+            if i:
+                yield b','
+            yield _dumps_bytes(point.to_frontend_json())
+        yield b'],"segments":['
+        for i, segment in enumerate(self._iter_segments()):
+            if i:
+                yield b','
+            yield _dumps_bytes(segment.to_frontend_json())
+        yield b']}'
+
+    def iter_frontend_jsonl(self) -> Iterator[bytes]:
+        """
+        Yield the frontend geometry as newline-delimited JSON records.
+
+        GeoJSON-Seq style stream: a site-level meta record first, then one
+        self-describing record per collection, feature, point and segment.
+        Unlike iter_frontend_chunks (which streams the standard document),
+        each line here parses on its own, so consumers can process records
+        incrementally and peak memory stays at one record per side.
+        """
+        yield _dumps_bytes({
+            'type': 'meta',
+            'metadata': self.__metadata if self.__metadata else {},
+            'attributes': self.attributes,
+            'version': self.__version,
+        }) + b'\n'
         for layer in self.__geometry_layers:
+            # Slim collection record; its parcels follow as feature records
+            yield _dumps_bytes({
+                'type': 'collection',
+                'id': layer.id,
+                'title': layer.title,
+                'attributes': layer.attributes,
+            }) + b'\n'
             for parcel in layer.parcels:
-                if parcel.geometry:
-                    segments.extend([seg.to_frontend_json() for seg in parcel.geometry.segments])
-        result['segments'] = segments
-        return result
-    
+                record = parcel.to_frontend_json()
+                record['type'] = 'feature'
+                record['collection'] = layer.id
+                yield _dumps_bytes(record) + b'\n'
+        for point in self.__points:
+            record = point.to_frontend_json()
+            record['type'] = 'point'
+            yield _dumps_bytes(record) + b'\n'
+        for segment in self._iter_segments():
+            record = segment.to_frontend_json()
+            record['type'] = 'segment'
+            yield _dumps_bytes(record) + b'\n'
+
     @classmethod
     def from_storage_json(cls, data: Dict[str, Any]) -> 'Site':
         """Create Site from storage JSON."""
         site = cls(
             project_id=data.get('projectId', ''),
-            site_id=data.get('siteId', str(uuid.uuid4())),
+            site_id=data.get('siteId') or uuid.uuid4().hex,
             name=data.get('name', ''),
             version=data.get('version', 0),
             history=data.get('history', {
@@ -1299,9 +1712,10 @@ class Site(GeometryObject):
         
         # Load session-based points (for backward compatibility)
         if 'points' in data and data['points']:
+            point_from_storage = Point.from_storage_json
+            add_point = site._add_point_unchecked
             for point_data in data['points']:
-                point = Point.from_storage_json(point_data)
-                site.add_point(point)
+                add_point(point_from_storage(point_data))
         
         # Handle session-based segments: if segments exist at top level,
         # add them to default layer (create if needed)
@@ -1318,7 +1732,7 @@ class Site(GeometryObject):
                 default_layer = GeometryLayer(
                     layer_type='Boundary',
                     name='Default Layer',
-                    id=str(uuid.uuid4())
+                    id=uuid.uuid4().hex
                 )
                 site.add_geometry_layer(default_layer)
             
@@ -1330,7 +1744,7 @@ class Site(GeometryObject):
                 default_parcel = Parcel(
                     name='Default Parcel',
                     feature_type='parcel',
-                    id=str(uuid.uuid4())
+                    id=uuid.uuid4().hex
                 )
                 default_layer.add_parcel(default_parcel)
             
@@ -1341,12 +1755,25 @@ class Site(GeometryObject):
             else:
                 geometry = default_parcel.geometry
             
-            # Add segments to geometry (only if not already present)
+            # Add segments to geometry (only if not already present).
+            # Duplicates are filtered on the raw ids before construction, so
+            # they never allocate an object, and the survivors go in through
+            # one bulk extend instead of per-segment appends.
+            segment_from_storage = Segment.from_storage_json
             existing_segment_ids = {seg.id for seg in geometry.segments}
-            for segment_data in data['segments']:
-                segment = Segment.from_storage_json(segment_data)
-                if segment.id not in existing_segment_ids:
-                    geometry.add_segment(segment)
+            if existing_segment_ids:
+                new_segments = [
+                    segment_from_storage(segment_data)
+                    for segment_data in data['segments']
+                    if segment_data.get('id') not in existing_segment_ids
+                ]
+            else:
+                # Fresh default geometry (the common case): no dedup needed
+                new_segments = [
+                    segment_from_storage(segment_data)
+                    for segment_data in data['segments']
+                ]
+            geometry._extend_segments_unchecked(new_segments)
         
         return site
     
@@ -1355,7 +1782,7 @@ class Site(GeometryObject):
         """Create Site from frontend JSON."""
         site = cls(
             project_id=data.get('projectId', ''),
-            site_id=data.get('siteId', str(uuid.uuid4())),
+            site_id=data.get('siteId') or uuid.uuid4().hex,
             name=data.get('metadata', {}).get('project', ''),
             metadata=data.get('metadata', {}),
             attributes=data.get('attributes', {}),
@@ -1369,9 +1796,10 @@ class Site(GeometryObject):
         
         # Handle old format with points and segments at top level
         if 'points' in data and data['points']:
+            point_from_frontend = Point.from_frontend_json
+            add_point = site._add_point_unchecked
             for point_data in data['points']:
-                point = Point.from_frontend_json(point_data)
-                site.add_point(point)
+                add_point(point_from_frontend(point_data))
         
         # Handle old format with segments at top level
         if 'segments' in data and data['segments'] and not site.geometry_layers:
@@ -1379,21 +1807,22 @@ class Site(GeometryObject):
             default_layer = GeometryLayer(
                 layer_type='Boundary',
                 name='Default Layer',
-                id=str(uuid.uuid4())
+                id=uuid.uuid4().hex
             )
             
             # Create default parcel
             default_parcel = Parcel(
                 name='Default Parcel',
                 feature_type='parcel',
-                id=str(uuid.uuid4())
+                id=uuid.uuid4().hex
             )
             
             # Create geometry and add segments
             geometry = Geometry(geometry_type='LineString', is_closed=False)
+            segment_from_frontend = Segment.from_frontend_json
+            add_segment = geometry._add_segment_unchecked
             for segment_data in data['segments']:
-                segment = Segment.from_frontend_json(segment_data)
-                geometry.add_segment(segment)
+                add_segment(segment_from_frontend(segment_data))
             
             default_parcel.geometry = geometry
             default_layer.add_parcel(default_parcel)
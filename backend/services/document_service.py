@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import mmap
+import os
+import shutil
 import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Final, Optional, Tuple
+from typing import BinaryIO, Dict, Final, Optional, Tuple
 
 from flask import current_app
 from werkzeug.datastructures import FileStorage
@@ -13,6 +18,7 @@ from backend.domain.documents import StoredDocument
 from backend.services.image_utils import encode_png
 from backend.services.pdf_converter import (
     PDFConversionError,
+    PDFConversionResult,
     PNG_EXPORT_DPI,
     pdf_to_png,
 )
@@ -25,7 +31,16 @@ except ImportError:  # pragma: no cover
     Image = None  # type: ignore[assignment]
 
 
-_ALLOWED_EXTENSIONS: Final[set[str]] = {"pdf", "png", "jpg", "jpeg", "tif", "tiff"}
+# Recent PDF conversions keyed by content digest: edit/retry flows re-upload
+# the same document, and hashing the mapped file runs in microseconds against
+# the render pass it skips. Results are frozen dataclasses, safe to share;
+# the small cap bounds the PNG bytes held alive.
+_PDF_CONVERSION_CACHE: OrderedDict[str, PDFConversionResult] = OrderedDict()
+_PDF_CONVERSION_CACHE_MAX = 8
+
+_ALLOWED_EXTENSIONS: Final[frozenset[str]] = frozenset(
+    {"pdf", "png", "jpg", "jpeg", "tif", "tiff"}
+)
 
 
 class DocumentStorageError(Exception):
@@ -44,6 +59,9 @@ class DocumentService:
         resolved_root = upload_root if upload_root.is_absolute() else upload_root.resolve()
         self._upload_root = resolved_root
         # Don't create directory here - it will be created per-session when needed
+        # Session directory pairs already resolved and created: repeat uploads
+        # skip the resolve() walk and both mkdir stats.
+        self._prepared_dirs: Dict[Path, Tuple[Path, Path]] = {}
 
     @classmethod
     def from_app_config(cls) -> "DocumentService":
@@ -82,15 +100,16 @@ class DocumentService:
         if not session_upload_dir or not session_processed_dir:
             raise DocumentStorageError("Session directories are required. session_id must be provided.")
         
-        upload_dir = session_upload_dir
-        processed_dir = session_processed_dir
-        # Ensure directories are absolute paths
-        upload_dir = upload_dir.resolve()
-        processed_dir = processed_dir.resolve()
-        
-        # Ensure directories exist
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        processed_dir.mkdir(parents=True, exist_ok=True)
+        prepared = self._prepared_dirs.get(session_upload_dir)
+        if prepared is not None:
+            upload_dir, processed_dir = prepared
+        else:
+            # Ensure directories are absolute paths and exist, once per session
+            upload_dir = session_upload_dir.resolve()
+            processed_dir = session_processed_dir.resolve()
+            upload_dir.mkdir(parents=True, exist_ok=True)
+            processed_dir.mkdir(parents=True, exist_ok=True)
+            self._prepared_dirs[session_upload_dir] = (upload_dir, processed_dir)
         
         original_path = upload_dir / original_stored_filename
         target_filename = f"{base_name}.png"
@@ -104,12 +123,15 @@ class DocumentService:
         except Exception:
             pass  # If not in Flask context, skip logging
 
-        content = file_storage.read()
-        if not content:
+        # Stream the upload straight to disk in chunks: the original never
+        # exists as one Python bytes object, so a large scanned plan costs
+        # page-cache pages rather than process RSS. Branches below that need
+        # the content reopen it from disk (a page-cache read at this point).
+        self._write_stream(file_storage.stream, original_path)
+        if original_path.stat().st_size == 0:
+            original_path.unlink(missing_ok=True)
             raise DocumentStorageError("Uploaded file is empty.")
 
-        self._write_bytes(content, original_path)
-
         warnings: list[str] = []
         image_width: Optional[int] = None
         image_height: Optional[int] = None
@@ -118,16 +140,29 @@ class DocumentService:
         if extension == "png":
             # For PNG files, save original to uploads and copy to processed_drawing
             if upload_dir != processed_dir:
-                # Save original to uploads and copy to processed_drawing
-                self._write_bytes(content, target_path)
+                # Stored files are immutable (uuid-named, never rewritten),
+                # so a hardlink is a safe zero-copy duplicate; across
+                # filesystems fall back to shutil.copyfile, which uses
+                # kernel-side copy (sendfile/copy_file_range) on Linux.
+                try:
+                    os.link(original_path, target_path)
+                except OSError:
+                    try:
+                        shutil.copyfile(original_path, target_path)
+                    except OSError as exc:
+                        raise DocumentStorageError(
+                            "Failed to write uploaded file."
+                        ) from exc
             else:
                 # Same directory: use same file for both
                 target_path = original_path
                 target_filename = original_stored_filename
             was_converted = False
-            image_width, image_height = self._extract_image_dimensions(content)
+            image_width, image_height = self._extract_image_dimensions_from_path(
+                original_path
+            )
         elif extension == "pdf":
-            conversion = self._convert_pdf(content)
+            conversion = self._convert_pdf_from_path(original_path)
             self._write_bytes(conversion.png_bytes, target_path)
             was_converted = True
             image_width = conversion.pixel_width
@@ -139,24 +174,27 @@ class DocumentService:
                     "PDF contains multiple pages. Only the first page was converted to PNG."
                 )
         else:
-            converted_bytes = self._convert_image_to_png(content)
+            converted_bytes = self._convert_image_file_to_png(original_path)
             self._write_bytes(converted_bytes, target_path)
             was_converted = True
             image_width, image_height = self._extract_image_dimensions(converted_bytes)
 
         if image_width is None or image_height is None:
-            image_width, image_height = self._extract_image_dimensions(
-                target_path.read_bytes()
+            image_width, image_height = self._extract_image_dimensions_from_path(
+                target_path
             )
 
         if boundary_box is None and image_width is not None and image_height is not None:
             boundary_box = self._default_boundary_box(image_width, image_height)
 
-        # Calculate relative paths
-        # Return paths relative to session directory
-        session_root = session_upload_dir.parent  # Go up from uploads/ to session directory
-        original_relative = original_path.relative_to(session_root).as_posix()
-        stored_relative = target_path.relative_to(session_root).as_posix()
+        # Calculate paths relative to the session directory. Both paths were
+        # built as directory/filename above, so their relative form is known
+        # literally - no Path.relative_to walk or Path allocations.
+        original_relative = f"{session_upload_dir.name}/{original_stored_filename}"
+        if target_path is original_path:
+            stored_relative = original_relative
+        else:
+            stored_relative = f"{session_processed_dir.name}/{target_filename}"
 
         return StoredDocument(
             original_filename=original_filename,
@@ -177,11 +215,17 @@ class DocumentService:
         except LocalFileStorageError as exc:
             raise DocumentStorageError("Failed to write uploaded file.") from exc
 
+    def _write_stream(self, stream: BinaryIO, path: Path) -> None:
+        try:
+            self._storage.save_stream(stream, path)
+        except LocalFileStorageError as exc:
+            raise DocumentStorageError("Failed to write uploaded file.") from exc
+
     @staticmethod
     def _extract_extension(filename: str) -> str:
-        if "." not in filename:
-            return ""
-        return filename.rsplit(".", 1)[1].lower()
+        # rfind + slice: no intermediate list, one scan instead of two
+        dot = filename.rfind(".")
+        return "" if dot < 0 else filename[dot + 1:].lower()
 
     @staticmethod
     def _as_relative_path(path: Path) -> str:
@@ -206,22 +250,52 @@ class DocumentService:
             return None, None
 
     @staticmethod
-    def _convert_image_to_png(raw_bytes: bytes) -> bytes:
+    def _extract_image_dimensions_from_path(
+        path: Path,
+    ) -> Tuple[Optional[int], Optional[int]]:
+        # Image.open parses only the header for width/height; no pixel decode
+        if Image is None:
+            return None, None
+
+        try:
+            with Image.open(path) as image:
+                return image.width, image.height
+        except (OSError, ValueError):
+            return None, None
+
+    @staticmethod
+    def _convert_image_file_to_png(path: Path) -> bytes:
         if Image is None:
             raise DocumentStorageError("Pillow is required to convert documents to PNG.")
 
         try:
-            with Image.open(io.BytesIO(raw_bytes)) as image:
+            with Image.open(path) as image:
                 return encode_png(image, PNG_EXPORT_DPI)
         except (OSError, ValueError) as error:
             raise DocumentStorageError("Failed to convert document to PNG.") from error
 
     @staticmethod
-    def _convert_pdf(raw_bytes: bytes):
+    def _convert_pdf_from_path(path: Path):
+        # Memory-map the file just streamed to disk: the renderer reads
+        # straight out of the page cache instead of a copied bytes object.
         try:
-            return pdf_to_png(raw_bytes)
+            with path.open("rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                digest = hashlib.blake2b(mapped, digest_size=16).hexdigest()
+                result = _PDF_CONVERSION_CACHE.get(digest)
+                if result is not None:
+                    _PDF_CONVERSION_CACHE.move_to_end(digest)
+                    return result
+                result = pdf_to_png(mapped)
+                _PDF_CONVERSION_CACHE[digest] = result
+                while len(_PDF_CONVERSION_CACHE) > _PDF_CONVERSION_CACHE_MAX:
+                    _PDF_CONVERSION_CACHE.popitem(last=False)
+                return result
         except PDFConversionError as error:
             raise DocumentStorageError(str(error)) from error
+        except (OSError, ValueError) as error:
+            raise DocumentStorageError("Failed to convert document to PNG.") from error
 
     @staticmethod
     def _bbox_tuple_to_mapping(bbox: Tuple[float, float, float, float]) -> Dict[str, float]:
@@ -2,17 +2,81 @@ from __future__ import annotations
 
 import json
 import math
+import mmap
+import os
 import uuid
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from flask import current_app
 
 from backend.services.session_service import SessionService, SessionNotFoundError
 from backend.domain.vectors import (
-    Site, Point, Segment, LineSegment, ArcSegment, Geometry, Parcel, GeometryLayer
+    Site, Point, Segment, LineSegment, ArcSegment, Geometry, Parcel, GeometryLayer,
+    _RAD2DEG,
 )
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+# Files past this size are memory-mapped for parsing; below it the plain
+# read is cheaper than the mapping setup (roughly page-cache scale).
+_MMAP_READ_THRESHOLD = 64 * 1024
+
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available.
+
+    Large files (multi-MB snapshots of busy sites) are memory-mapped and
+    handed to orjson as a zero-copy view, so parsing runs straight off the
+    page cache instead of first copying the whole file into a bytes object.
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_READ_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    # The view must be released before the mapping closes
+                    view.release()
+        return orjson.loads(f.read())
+
+
+def _write_json_file_atomic(path: Path, data: Any) -> None:
+    """Write data as compact JSON via a temp file and atomic rename.
+
+    Compact output roughly halves the bytes written per edit (and parsed on
+    the next load) versus indent=2; the fsync-then-replace sequence
+    guarantees readers never see a truncated file and that the rename only
+    lands once the bytes are durable, so a crash mid-save leaves the old
+    state intact rather than corrupting the source of truth.
+    """
+    if orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# Sentinel for _payloads_equal: distinguishes "key absent" from a None value.
+_MISSING = object()
+
 
 class GeometryError(Exception):
     """Base exception raised for geometry management issues."""
@@ -27,6 +91,19 @@ class GeometryService:
 
     def __init__(self, session_service: SessionService) -> None:
         self._session_service = session_service
+        # session_id -> (current.json mtime_ns, Site) written by the last
+        # save. Entries are popped on use, never shared: each cached Site is
+        # handed to exactly one caller, so an edit that fails before saving
+        # cannot pollute what later loads see - they just reparse from disk.
+        self._site_cache: Dict[int, Tuple[int, Site]] = {}
+        # Saves per session in this process; drives the amortized version
+        # cleanup in save_geometry.
+        self._save_count: Dict[int, int] = {}
+        # geom_tmp directories already looked up and created: every request
+        # funnels through get_geometry_path, so without this each one pays a
+        # session-registry lookup plus mkdir/stat syscalls for a directory
+        # that has existed since the session was created.
+        self._geom_dir_cache: Dict[int, Path] = {}
     
     # Helper methods for working with Site objects
     
@@ -51,6 +128,31 @@ class GeometryService:
         site = Site.from_storage_json(data)
         return site
     
+    # Storage keys that churn on every save without representing a user edit:
+    # version/history are bumped by save_geometry itself, and the frontend
+    # format carries neither siteId (regenerated per round-trip) nor name
+    # (rebuilt from metadata.project, and metadata is still compared).
+    _BOOKKEEPING_KEYS = frozenset(("version", "history", "siteId", "name"))
+
+    @staticmethod
+    def _payloads_equal(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+        """Compare two storage dicts ignoring save-to-save bookkeeping keys.
+
+        Plain dict equality is used rather than hashing serialized bytes:
+        both dicts are already built, and == short-circuits on the first
+        differing value.
+        """
+        skip = GeometryService._BOOKKEEPING_KEYS
+        for key, value in a.items():
+            if key in skip:
+                continue
+            if b.get(key, _MISSING) != value:
+                return False
+        for key in b:
+            if key not in skip and key not in a:
+                return False
+        return True
+
     def _get_or_create_default_layer(self, site: Site) -> GeometryLayer:
         """Get or create default geometry layer for session-based geometry."""
         # Try to find existing default layer
@@ -62,7 +164,7 @@ class GeometryService:
         default_layer = GeometryLayer(
             layer_type='Boundary',
             name='Default Layer',
-            id=str(uuid.uuid4())
+            id=uuid.uuid4().hex
         )
         site.add_geometry_layer(default_layer)
         return default_layer
@@ -76,7 +178,7 @@ class GeometryService:
         default_parcel = Parcel(
             name='Default Parcel',
             feature_type='parcel',
-            id=str(uuid.uuid4())
+            id=uuid.uuid4().hex
         )
         layer.add_parcel(default_parcel)
         return default_parcel
@@ -91,14 +193,141 @@ class GeometryService:
         parcel.geometry = geometry
         return geometry
 
+    @staticmethod
+    def _build_segment(
+        start_x: float,
+        start_y: float,
+        end_x: float,
+        end_y: float,
+        attributes: Optional[Dict[str, Any]] = None,
+        segment_type: str = "line",
+        *,
+        _length: Optional[float] = None,
+        _azimuth: Optional[float] = None
+    ) -> Segment:
+        """Construct a segment with computed length and azimuth.
+
+        _length/_azimuth let _build_segments_batch pass in values it already
+        computed vectorized; callers outside this class leave them unset.
+        """
+        if _length is None:
+            # Calculate length
+            dx = end_x - start_x
+            dy = end_y - start_y
+            length = math.hypot(dx, dy)
+
+            # Calculate azimuth for line segments
+            # atan2 gives angle from East (0°=East, 90°=North, 180°=West, 270°=South)
+            # Convert to azimuth (0°=North, 90°=East, 180°=South, 270°=West, clockwise)
+            angle_deg = math.atan2(dy, dx) * _RAD2DEG
+            # Formula: azimuth = (90 - angle_deg) % 360
+            azimuth = (90 - angle_deg) % 360
+        else:
+            length = _length
+            azimuth = _azimuth
+
+        # Create segment object
+        segment_attributes = attributes or {}
+        start = {"x": float(start_x), "y": float(start_y)}
+        end = {"x": float(end_x), "y": float(end_y)}
+
+        if segment_type == "line":
+            return LineSegment(
+                start=start,
+                end=end,
+                bearing=azimuth,  # Will be stored as azimuth internally
+                length=float(length),
+                layer=segment_attributes.get("layer", ""),
+                attributes=segment_attributes
+            )
+        elif segment_type == "arc":
+            # For arc, we need center, radius, rotation - use defaults if not provided
+            center = segment_attributes.get("center", start)
+            radius = segment_attributes.get("radius", length / 2)
+            rotation = segment_attributes.get("rotation", "cw")
+            delta = segment_attributes.get("delta")
+
+            return ArcSegment(
+                start=start,
+                end=end,
+                center=center,
+                radius=float(radius),
+                rotation=rotation,
+                delta=delta,
+                length=float(length),
+                layer=segment_attributes.get("layer", ""),
+                attributes=segment_attributes
+            )
+        else:
+            raise ValueError(f"Unknown segment type: {segment_type}")
+
+    @classmethod
+    def _build_segments_batch(cls, segment_dicts: List[Dict[str, Any]]) -> List[Segment]:
+        """Construct many segments with lengths/azimuths computed in one pass.
+
+        The dominant bulk case is a CAD import posting hundreds of line
+        segments at once: with numpy available, hypot and atan2 run as
+        vectorized C calls over the whole coordinate array instead of one
+        scalar math call per segment. Small batches (where array setup
+        outweighs the loop) and numpy-less deployments take the scalar path.
+        """
+        build = cls._build_segment
+        if np is None or len(segment_dicts) < 16:
+            return [
+                build(
+                    float(sd.get("startX", 0)),
+                    float(sd.get("startY", 0)),
+                    float(sd.get("endX", 0)),
+                    float(sd.get("endY", 0)),
+                    sd.get("attributes"),
+                    segment_type=sd.get("segmentType", "line")
+                )
+                for sd in segment_dicts
+            ]
+
+        coords = np.array(
+            [
+                [
+                    float(sd.get("startX", 0)),
+                    float(sd.get("startY", 0)),
+                    float(sd.get("endX", 0)),
+                    float(sd.get("endY", 0)),
+                ]
+                for sd in segment_dicts
+            ],
+            dtype=np.float64,
+        )
+        dx = coords[:, 2] - coords[:, 0]
+        dy = coords[:, 3] - coords[:, 1]
+        lengths = np.hypot(dx, dy)
+        azimuths = (90.0 - np.degrees(np.arctan2(dy, dx))) % 360.0
+
+        return [
+            build(
+                coords[i, 0],
+                coords[i, 1],
+                coords[i, 2],
+                coords[i, 3],
+                sd.get("attributes"),
+                segment_type=sd.get("segmentType", "line"),
+                _length=float(lengths[i]),
+                _azimuth=float(azimuths[i]),
+            )
+            for i, sd in enumerate(segment_dicts)
+        ]
+
     def get_geometry_path(self, session_id: int) -> Path:
         """Get path to geometry_tmp directory for a session."""
+        geom_tmp_dir = self._geom_dir_cache.get(session_id)
+        if geom_tmp_dir is not None:
+            return geom_tmp_dir
         session = self._session_service.get_session(session_id)
         catalog_name = session["storage_catalog_name"]
         instance_path = Path(current_app.instance_path)
         session_dir = instance_path / "sessions_id_" / catalog_name
         geom_tmp_dir = session_dir / "geom_tmp"
         geom_tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._geom_dir_cache[session_id] = geom_tmp_dir
         return geom_tmp_dir
 
     def get_current_geometry_file(self, session_id: int) -> Path:
@@ -106,6 +335,47 @@ class GeometryService:
         geom_tmp_dir = self.get_geometry_path(session_id)
         return geom_tmp_dir / "current.json"
 
+    def get_current_version(self, session_id: int) -> int:
+        """
+        Read only the current version number for a session's geometry.
+
+        Cheaper than load_current_geometry because no Site object graph is
+        built; used for ETag comparison before deciding to serialize.
+        """
+        current_file = self.get_current_geometry_file(session_id)
+
+        if not current_file.exists():
+            return 0
+
+        try:
+            data = _read_json_file(current_file)
+            return int(data.get("version", 0))
+        except (ValueError, OSError) as e:
+            raise GeometryError(f"Failed to load geometry: {e}") from e
+
+    def get_current_state_stamp(self, session_id: int) -> Tuple[int, int]:
+        """
+        Return (version, current.json st_mtime_ns) for a session's geometry.
+
+        The version alone cannot identify a response body: undo reissues
+        version numbers, so two different states can share one. The mtime
+        stamp changes on every durable write - including undo - which makes
+        the pair a safe cache and ETag key. Returns (0, 0) when no geometry
+        has been saved yet.
+        """
+        current_file = self.get_current_geometry_file(session_id)
+
+        try:
+            stamp = current_file.stat().st_mtime_ns
+        except OSError:
+            return 0, 0
+
+        try:
+            data = _read_json_file(current_file)
+            return int(data.get("version", 0)), stamp
+        except (ValueError, OSError) as e:
+            raise GeometryError(f"Failed to load geometry: {e}") from e
+
     def load_current_geometry(self, session_id: int, as_site: bool = False) -> Union[Dict[str, Any], Site]:
         """
         Load current geometry state for a session.
@@ -136,15 +406,26 @@ class GeometryService:
                     "geometryLayers": []
                 }
         
+        if as_site:
+            # Reuse the Site written by this process's last save when the
+            # file has not changed underneath it; skips the read and the
+            # whole from_storage_json rebuild on back-to-back edits.
+            cached = self._site_cache.pop(session_id, None)
+            if cached is not None:
+                try:
+                    if cached[0] == current_file.stat().st_mtime_ns:
+                        return cached[1]
+                except OSError:
+                    pass
+
         try:
-            with open(current_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _read_json_file(current_file)
+
             if as_site:
                 return self._load_site_from_json(data, session_id)
             else:
                 return data
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, OSError) as e:
             raise GeometryError(f"Failed to load geometry: {e}") from e
 
     def save_geometry(
@@ -168,20 +449,11 @@ class GeometryService:
             Site object if geometry_data is Site, otherwise JSON dict
         """
         geom_tmp_dir = self.get_geometry_path(session_id)
-        
+
         # Load current state
         current_site = self.load_current_geometry(session_id, as_site=True)
         current_version = current_site.version
-        
-        # Save current version to tmp/ before updating
-        if current_version > 0:
-            previous_version_file = f"version_{current_version}.json"
-            version_file = geom_tmp_dir / previous_version_file
-            with open(version_file, 'w', encoding='utf-8') as f:
-                json.dump(current_site.to_storage_json(), f, indent=2, ensure_ascii=False)
-        else:
-            previous_version_file = None
-        
+
         # Convert geometry_data to Site if needed
         if isinstance(geometry_data, Site):
             site = geometry_data
@@ -189,36 +461,93 @@ class GeometryService:
             # Backward compatibility: convert dict to Site
             geometry_data["sessionId"] = session_id
             site = self._load_site_from_json(geometry_data, session_id)
-        
+
         # Ensure session_id is set
         if site.session_id is None:
             site.session_id = session_id
-        
+
+        try:
+            candidate_storage = site.to_storage_json()
+        except Exception as e:
+            current_app.logger.error(f"Error converting Site to storage JSON: {e}", exc_info=True)
+            raise GeometryError(f"Failed to convert Site to JSON: {e}") from e
+
+        # No-op detection: if the candidate matches what is already on disk
+        # (version/history aside), skip the snapshot, the version bump and
+        # both writes entirely. Catches same-coordinate updates and frontend
+        # autosaves; the current-state dict is needed for the snapshot write
+        # below anyway, so the comparison costs no extra serialization.
+        current_storage = current_site.to_storage_json() if current_version > 0 else None
+        if current_storage is not None and self._payloads_equal(
+            candidate_storage, current_storage
+        ):
+            # Disk already holds this state; hand the parsed Site back to
+            # the next load so the skipped save still refreshes the cache.
+            try:
+                current_file = self.get_current_geometry_file(session_id)
+                self._site_cache[session_id] = (
+                    current_file.stat().st_mtime_ns, current_site
+                )
+            except OSError:
+                pass
+            if isinstance(geometry_data, Site):
+                # Callers read version off the result; reflect the on-disk
+                # state the candidate was found equal to.
+                site.version = current_version
+                site.history = current_site.history
+                return site
+            return current_storage
+
+        # Save current version to tmp/ before updating
+        if current_storage is not None:
+            previous_version_file = f"version_{current_version}.json"
+            version_file = geom_tmp_dir / previous_version_file
+            # Compact like current.json: archives are internal undo state,
+            # never read by humans, and indent=2 cost 2-3x the bytes across
+            # 20 retained versions per session.
+            _write_json_file_atomic(version_file, current_storage)
+        else:
+            previous_version_file = None
+
         # Update version and history
         new_version = current_version + 1
         site.version = new_version
-        site.history = {
+        history = {
             "currentVersion": new_version,
             "previousVersionFile": previous_version_file
         }
-        
+        site.history = history
+
+        # The bump only touches the two top-level bookkeeping fields, so
+        # patch them on the dict already built for the no-op comparison
+        # rather than walking the whole Site a second time.
+        storage_json = candidate_storage
+        storage_json["version"] = new_version
+        storage_json["history"] = history
+
         # Save new current.json
         current_file = self.get_current_geometry_file(session_id)
         try:
-            storage_json = site.to_storage_json()
-        except Exception as e:
-            current_app.logger.error(f"Error converting Site to storage JSON: {e}", exc_info=True)
-            raise GeometryError(f"Failed to convert Site to JSON: {e}") from e
-        
-        try:
-            with open(current_file, 'w', encoding='utf-8') as f:
-                json.dump(storage_json, f, indent=2, ensure_ascii=False)
+            _write_json_file_atomic(current_file, storage_json)
         except (IOError, OSError) as e:
             current_app.logger.error(f"Error writing geometry file: {e}", exc_info=True)
             raise GeometryError(f"Failed to save geometry file: {e}") from e
         
-        # Cleanup old versions (keep max 20 files)
-        self._cleanup_old_versions(geom_tmp_dir, max_versions=20)
+        # What we just wrote is the current state; hand it to the next load
+        try:
+            self._site_cache[session_id] = (current_file.stat().st_mtime_ns, site)
+        except OSError:
+            self._site_cache.pop(session_id, None)
+
+        # Cleanup old versions (keep max 20 files). Globbing, parsing and
+        # sorting the directory on every edit is pure overhead during rapid
+        # editing, so sweep on the first save of the process (to bound any
+        # leftovers) and every 10th after that; at most a handful of extra
+        # snapshots linger between sweeps.
+        count = self._save_count.get(session_id, 0) + 1
+        self._save_count[session_id] = count
+        if count == 1 or count % 10 == 0:
+            self._cleanup_old_versions(geom_tmp_dir, max_versions=20)
         
         # Return in same format as input
         if isinstance(geometry_data, Site):
@@ -232,8 +561,8 @@ class GeometryService:
         x: float,
         y: float,
         attributes: Optional[Dict[str, Any]] = None
-    ) -> Union[Dict[str, Any], Site]:
-        """Add a point to the geometry."""
+    ) -> Tuple[Site, Point]:
+        """Add a point to the geometry. Returns the saved Site and new Point."""
         try:
             site = self.load_current_geometry(session_id, as_site=True)
             
@@ -252,9 +581,10 @@ class GeometryService:
             
             # Add point to site
             site.add_point(new_point)
-            
+
             # Save with versioning
-            return self.save_geometry(session_id, site, action="add_point")
+            site = self.save_geometry(session_id, site, action="add_point")
+            return site, new_point
         except Exception as e:
             current_app.logger.error(f"Error in add_point: {e}", exc_info=True)
             raise
@@ -267,7 +597,7 @@ class GeometryService:
         y: Optional[float] = None,
         layer: Optional[str] = None,
         attributes: Optional[Dict[str, Any]] = None
-    ) -> Union[Dict[str, Any], Site]:
+    ) -> Site:
         """Update a point in the geometry."""
         site = self.load_current_geometry(session_id, as_site=True)
         
@@ -292,6 +622,24 @@ class GeometryService:
         # Save with versioning
         return self.save_geometry(session_id, site, action="update_point")
 
+    def move_point(self, session_id: int, point_id: str, x: float, y: float) -> Site:
+        """Update only a point's coordinates.
+
+        Fast path for the drag-endpoint case ({"x": ..., "y": ...} with no
+        layer or attribute changes), skipping the optional-field branching
+        and attribute merge in update_point.
+        """
+        site = self.load_current_geometry(session_id, as_site=True)
+
+        point = site.get_point(point_id)
+        if not point:
+            raise GeometryNotFoundError(f"Point with id {point_id} not found")
+
+        point.x = x
+        point.y = y
+
+        return self.save_geometry(session_id, site, action="update_point")
+
     def add_segment(
         self,
         session_id: int,
@@ -301,77 +649,106 @@ class GeometryService:
         end_y: float,
         attributes: Optional[Dict[str, Any]] = None,
         segment_type: str = "line"
-    ) -> Union[Dict[str, Any], Site]:
-        """Add a segment to the geometry."""
+    ) -> Tuple[Site, Segment]:
+        """Add a segment to the geometry. Returns the saved Site and new Segment."""
         try:
             site = self.load_current_geometry(session_id, as_site=True)
-            
+
             # Ensure session_id is set
             if site.session_id is None:
                 site.session_id = session_id
-            
-            # Calculate length
-            dx = end_x - start_x
-            dy = end_y - start_y
-            length = (dx ** 2 + dy ** 2) ** 0.5
-            
-            # Calculate azimuth for line segments
-            # atan2 gives angle from East (0°=East, 90°=North, 180°=West, 270°=South)
-            # Convert to azimuth (0°=North, 90°=East, 180°=South, 270°=West, clockwise)
-            angle_rad = math.atan2(dy, dx)
-            angle_deg = math.degrees(angle_rad)
-            # Formula: azimuth = (90 - angle_deg) % 360
-            azimuth = (90 - angle_deg) % 360
-            
+
             # Get or create default layer and parcel
             default_layer = self._get_or_create_default_layer(site)
             default_parcel = self._get_or_create_default_parcel(default_layer)
             geometry = self._get_or_create_default_geometry(default_parcel)
-            
-            # Create segment object
-            segment_attributes = attributes or {}
-            start = {"x": float(start_x), "y": float(start_y)}
-            end = {"x": float(end_x), "y": float(end_y)}
-            
-            if segment_type == "line":
-                new_segment = LineSegment(
-                    start=start,
-                    end=end,
-                    bearing=azimuth,  # Will be stored as azimuth internally
-                    length=float(length),
-                    layer=segment_attributes.get("layer", ""),
-                    attributes=segment_attributes
-                )
-            elif segment_type == "arc":
-                # For arc, we need center, radius, rotation - use defaults if not provided
-                center = segment_attributes.get("center", start)
-                radius = segment_attributes.get("radius", length / 2)
-                rotation = segment_attributes.get("rotation", "cw")
-                delta = segment_attributes.get("delta")
-                
-                new_segment = ArcSegment(
-                    start=start,
-                    end=end,
-                    center=center,
-                    radius=float(radius),
-                    rotation=rotation,
-                    delta=delta,
-                    length=float(length),
-                    layer=segment_attributes.get("layer", ""),
-                    attributes=segment_attributes
-                )
-            else:
-                raise ValueError(f"Unknown segment type: {segment_type}")
-            
+
+            new_segment = self._build_segment(
+                start_x, start_y, end_x, end_y, attributes, segment_type=segment_type
+            )
+
             # Add segment to geometry
             geometry.add_segment(new_segment)
-            
+
             # Save with versioning
-            return self.save_geometry(session_id, site, action="add_segment")
+            site = self.save_geometry(session_id, site, action="add_segment")
+            return site, new_segment
         except Exception as e:
             current_app.logger.error(f"Error in add_segment: {e}", exc_info=True)
             raise
 
+    def add_batch(
+        self,
+        session_id: int,
+        points: Optional[List[Dict[str, Any]]] = None,
+        segments: Optional[List[Dict[str, Any]]] = None,
+        point_updates: Optional[List[Dict[str, Any]]] = None,
+        action: str = "batch_add"
+    ) -> Tuple[Site, List[str], List[str], List[str]]:
+        """
+        Apply many adds and point updates in a single load/save cycle.
+
+        Amortizes the per-request geometry load, version bump and persisted
+        write over the whole batch instead of paying them once per object -
+        a coalesced drag, for instance, flushes as one versioned save
+        instead of one rewrite per pointer event.
+
+        Returns:
+            (site, added_point_ids, added_segment_ids, updated_point_ids)
+        """
+        site = self.load_current_geometry(session_id, as_site=True)
+
+        # Ensure session_id is set
+        if site.session_id is None:
+            site.session_id = session_id
+
+        added_point_ids: List[str] = []
+        added_segment_ids: List[str] = []
+        updated_point_ids: List[str] = []
+
+        # Same semantics per entry as update_point: partial fields allowed,
+        # attributes merge rather than replace.
+        for update in point_updates or []:
+            point_id = str(update.get("id", ""))
+            point = site.get_point(point_id)
+            if not point:
+                raise GeometryNotFoundError(f"Point with id {point_id} not found")
+            if update.get("x") is not None:
+                point.x = float(update["x"])
+            if update.get("y") is not None:
+                point.y = float(update["y"])
+            if update.get("layer") is not None:
+                point.layer = update["layer"]
+            if update.get("attributes") is not None:
+                current_attrs = point.attributes
+                current_attrs.update(update["attributes"])
+                point.attributes = current_attrs
+            updated_point_ids.append(point.id)
+
+        for point_data in points or []:
+            point_attributes = point_data.get("attributes") or {}
+            new_point = Point(
+                x=float(point_data.get("x", 0)),
+                y=float(point_data.get("y", 0)),
+                layer=point_attributes.get("layer", ""),
+                attributes=point_attributes
+            )
+            site.add_point(new_point)
+            added_point_ids.append(new_point.id)
+
+        if segments:
+            default_layer = self._get_or_create_default_layer(site)
+            default_parcel = self._get_or_create_default_parcel(default_layer)
+            geometry = self._get_or_create_default_geometry(default_parcel)
+
+            for new_segment in self._build_segments_batch(segments):
+                geometry.add_segment(new_segment)
+                added_segment_ids.append(new_segment.id)
+
+        # Save once with versioning
+        site = self.save_geometry(session_id, site, action=action)
+        return site, added_point_ids, added_segment_ids, updated_point_ids
+
     def update_segment(
         self,
         session_id: int,
@@ -382,7 +759,7 @@ class GeometryService:
         end_y: float,
         layer: Optional[str] = None,
         attributes: Optional[Dict[str, Any]] = None
-    ) -> Union[Dict[str, Any], Site]:
+    ) -> Site:
         """Update a segment in the geometry."""
         site = self.load_current_geometry(session_id, as_site=True)
         
@@ -398,15 +775,13 @@ class GeometryService:
         # Recalculate length
         dx = end_x - start_x
         dy = end_y - start_y
-        segment.length = float((dx ** 2 + dy ** 2) ** 0.5)
-        
+        segment.length = float(math.hypot(dx, dy))
+
         # Update azimuth for line segments
         if isinstance(segment, LineSegment):
-            import math
             # atan2 gives angle from East (0°=East, 90°=North, 180°=West, 270°=South)
             # Convert to azimuth (0°=North, 90°=East, 180°=South, 270°=West, clockwise)
-            angle_rad = math.atan2(dy, dx)
-            angle_deg = math.degrees(angle_rad)
+            angle_deg = math.atan2(dy, dx) * _RAD2DEG
             # Formula: azimuth = (90 - angle_deg) % 360
             azimuth = (90 - angle_deg) % 360
             segment.azimuth = azimuth
@@ -424,49 +799,96 @@ class GeometryService:
         # Save with versioning
         return self.save_geometry(session_id, site, action="update_segment")
 
+    def recalculate_segment(
+        self,
+        session_id: int,
+        segment_id: str,
+        quadrant: str,
+        bearing: float,
+        distance: float,
+        blocked_point: str = "start_pt"
+    ) -> Site:
+        """
+        Recalculate a line segment using bearing and distance, then save.
+
+        Loads the geometry once, patches the target segment in place and
+        persists with versioning — the caller never touches the Site.
+        """
+        site = self.load_current_geometry(session_id, as_site=True)
+
+        # Find segment
+        segment = site.get_segment_by_id(segment_id)
+        if not segment:
+            raise GeometryNotFoundError(f"Segment with id {segment_id} not found")
+
+        if not isinstance(segment, LineSegment):
+            raise GeometryError(f"Segment {segment_id} is not a line segment")
+
+        segment.recalculate_by_bearing_and_distance(
+            quadrant=quadrant,
+            bearing=bearing,
+            distance=distance,
+            blocked_point=blocked_point
+        )
+
+        # Save with versioning
+        return self.save_geometry(session_id, site, action="recalculate_segment")
+
+    def undo_and_get_version(self, session_id: int) -> int:
+        """
+        Undo the last action and return only the resulting version number.
+
+        Fast path for the undo endpoint: the caller only needs the new
+        version, so no Site object graph is ever built.
+        """
+        return int(self.undo(session_id)["version"])
+
     def undo(self, session_id: int, as_site: bool = False) -> Union[Dict[str, Any], Site]:
-        """Undo last action by loading previous version."""
-        current_site = self.load_current_geometry(session_id, as_site=True)
-        
-        if not current_site.history or not current_site.history.get("previousVersionFile"):
+        """Undo last action by restoring the previous version snapshot.
+
+        Semantically a pointer swap: the snapshot already is the complete
+        previous state, so this works on raw JSON dicts and only patches the
+        top-level version field - no Site graph is built (or re-serialized)
+        unless the caller asks for one with as_site=True.
+        """
+        current_file = self.get_current_geometry_file(session_id)
+
+        if not current_file.exists():
             raise GeometryError("No actions to undo")
-        
-        previous_version_file = current_site.history["previousVersionFile"]
-        geom_tmp_dir = self.get_geometry_path(session_id)
-        version_file = geom_tmp_dir / previous_version_file
-        
+
+        try:
+            current_data = _read_json_file(current_file)
+        except (ValueError, OSError) as e:
+            raise GeometryError(f"Failed to load geometry: {e}") from e
+
+        history = current_data.get("history") or {}
+        previous_version_file = history.get("previousVersionFile")
+        if not previous_version_file:
+            raise GeometryError("No actions to undo")
+
+        version_file = current_file.parent / previous_version_file
         if not version_file.exists():
             raise GeometryNotFoundError(f"Previous version file {previous_version_file} not found")
-        
-        # Load previous version
-        with open(version_file, 'r', encoding='utf-8') as f:
-            previous_data = json.load(f)
-        
-        # Convert to Site
-        previous_site = self._load_site_from_json(previous_data, session_id)
-        
-        # Update version (decrement)
-        previous_site.version = current_site.version - 1
-        # History is already set in the previous version file
-        
-        # Save as current
-        current_file = self.get_current_geometry_file(session_id)
-        storage_json = previous_site.to_storage_json()
-        with open(current_file, 'w', encoding='utf-8') as f:
-            json.dump(storage_json, f, indent=2, ensure_ascii=False)
-        
-        # Return in requested format
+
+        previous_data = _read_json_file(version_file)
+
+        # Update version (decrement); history is already set in the previous
+        # version file.
+        previous_data["version"] = int(current_data.get("version", 0)) - 1
+        previous_data["sessionId"] = session_id
+
+        _write_json_file_atomic(current_file, previous_data)
+
         if as_site:
-            return previous_site
-        else:
-            return storage_json
+            return self._load_site_from_json(previous_data, session_id)
+        return previous_data
 
     def delete_object(
         self,
         session_id: int,
         object_type: str,
         object_id: str
-    ) -> Union[Dict[str, Any], Site]:
+    ) -> Site:
         """
         Delete an object (point, segment, parcel, layer, etc.) from the geometry.
         
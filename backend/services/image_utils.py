@@ -20,21 +20,35 @@ def encode_png(image: "Image.Image", dpi: int) -> bytes:
 
     processed = image
 
-    if processed.mode not in ("RGB", "L"):
+    # Palette inputs are already quantized: converting P -> RGB only to
+    # MEDIANCUT back down to 256 colors is a full O(W*H) round-trip for a
+    # usually-worse palette, so they pass straight through to the encoder.
+    if processed.mode not in ("RGB", "L", "P"):
         processed = processed.convert("RGB")
     if processed.mode == "RGB":
-        processed = processed.quantize(
-            colors=DEFAULT_PNG_COLORS,
-            method=Image.MEDIANCUT,
-            dither=Image.Dither.NONE,
-        )
+        # Plan scans are mostly line art that renders to a handful of
+        # distinct colors; one cheap counting pass detects that, and the
+        # exact colors become the palette directly - no MEDIANCUT search.
+        sparse_colors = processed.getcolors(DEFAULT_PNG_COLORS)
+        if sparse_colors is not None:
+            processed = processed.convert(
+                "P", palette=Image.ADAPTIVE, colors=len(sparse_colors)
+            )
+        else:
+            processed = processed.quantize(
+                colors=DEFAULT_PNG_COLORS,
+                method=Image.MEDIANCUT,
+                dither=Image.Dither.NONE,
+            )
 
     buffer = io.BytesIO()
+    # compress_level=3 without optimize: zlib level 9 plus Pillow's filter
+    # search dominated conversion wall-clock, and on already-quantized
+    # palette data the extra effort buys only a few percent smaller output.
     processed.save(
         buffer,
         format="PNG",
-        optimize=True,
-        compress_level=9,
+        compress_level=3,
         dpi=(dpi, dpi),
         bits=8,
     )
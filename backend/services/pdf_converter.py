@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import io
 from dataclasses import dataclass
-from typing import Final
+from typing import BinaryIO, Final, Union
 
 try:  # pragma: no cover
     import pypdfium2 as pdfium  # type: ignore
@@ -34,8 +34,20 @@ class PDFConversionResult:
     page_bbox: tuple[float, float, float, float]
 
 
-def pdf_to_png(raw_bytes: bytes, dpi: int = PNG_EXPORT_DPI) -> PDFConversionResult:
-    """Convert the first page of a PDF to PNG bytes."""
+def _as_buffer(raw: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a stream; pass seekable file objects (mmap) through."""
+    if isinstance(raw, (bytes, bytearray)):
+        return io.BytesIO(raw)
+    return raw
+
+
+def pdf_to_png(raw_bytes: Union[bytes, BinaryIO], dpi: int = PNG_EXPORT_DPI) -> PDFConversionResult:
+    """Convert the first page of a PDF to PNG bytes.
+
+    Accepts either the document bytes or a seekable binary file object
+    (e.g. an mmap over the file on disk, which avoids materializing the
+    whole PDF as a Python bytes object).
+    """
     if pdfium is not None:
         return _pdfium_to_png(raw_bytes, dpi)
 
@@ -45,7 +57,7 @@ def pdf_to_png(raw_bytes: bytes, dpi: int = PNG_EXPORT_DPI) -> PDFConversionResu
         )
 
     try:
-        with Image.open(io.BytesIO(raw_bytes)) as pdf_image:
+        with Image.open(_as_buffer(raw_bytes)) as pdf_image:
             total_frames = getattr(pdf_image, "n_frames", 1)
             pdf_image.seek(0)
             pixel_width, pixel_height = pdf_image.size
@@ -67,42 +79,72 @@ def pdf_to_png(raw_bytes: bytes, dpi: int = PNG_EXPORT_DPI) -> PDFConversionResu
         ) from exc
 
 
-def _pdfium_to_png(raw_bytes: bytes, dpi: int) -> PDFConversionResult:
+def _extract_single_page_image(page) -> "Image.Image | None":
+    """Return the page's sole raster image if it covers the page, else None.
+
+    Scanner-produced PDFs are usually one full-page image; decoding that
+    embedded stream at its native resolution skips the scaled rasterization
+    pass entirely. Best effort: any surprise in the page structure or the
+    pdfium bindings just means the caller renders normally.
+    """
+    try:
+        images = list(
+            page.get_objects(filter=(pdfium.raw.FPDF_PAGEOBJ_IMAGE,), max_depth=1)
+        )
+        if len(images) != 1:
+            return None
+        left, bottom, right, top = images[0].get_pos()
+        p_left, p_bottom, p_right, p_top = page.get_bbox()
+        page_width = p_right - p_left
+        page_height = p_top - p_bottom
+        if page_width <= 0 or page_height <= 0:
+            return None
+        if (right - left) < 0.95 * page_width or (top - bottom) < 0.95 * page_height:
+            return None
+        return images[0].get_bitmap(render=False).to_pil()
+    except Exception:  # pragma: no cover - fall back to the full render
+        return None
+
+
+def _pdfium_to_png(raw_bytes: Union[bytes, BinaryIO], dpi: int) -> PDFConversionResult:
     if pdfium is None:
         raise PDFConversionError("PDFium backend is not available.")
 
     try:
-        with io.BytesIO(raw_bytes) as buffer:
-            pdf = pdfium.PdfDocument(buffer)
-            if len(pdf) == 0:
-                raise PDFConversionError("Provided PDF has no pages.")
-
-            page = pdf[0]
-            scale = dpi / 72.0
-            bitmap = page.render(scale=scale)
+        buffer = _as_buffer(raw_bytes)
+        pdf = pdfium.PdfDocument(buffer)
+        if len(pdf) == 0:
+            raise PDFConversionError("Provided PDF has no pages.")
+
+        page = pdf[0]
+        bitmap = None
+        pil_image = _extract_single_page_image(page)
+        if pil_image is None:
+            bitmap = page.render(scale=dpi / 72.0)
             pil_image = bitmap.to_pil()
-            pixel_width, pixel_height = pil_image.size
-            png_bytes = encode_png(pil_image, dpi)
-            had_multiple_pages = len(pdf) > 1
-            bbox = page.get_bbox()
-            page_bbox = (
-                float(getattr(bbox, "left", 0.0)),
-                float(getattr(bbox, "bottom", 0.0)),
-                float(getattr(bbox, "right", pixel_width)),
-                float(getattr(bbox, "top", pixel_height)),
-            )
-            pil_image.close()
+        pixel_width, pixel_height = pil_image.size
+        png_bytes = encode_png(pil_image, dpi)
+        had_multiple_pages = len(pdf) > 1
+        bbox = page.get_bbox()
+        page_bbox = (
+            float(getattr(bbox, "left", 0.0)),
+            float(getattr(bbox, "bottom", 0.0)),
+            float(getattr(bbox, "right", pixel_width)),
+            float(getattr(bbox, "top", pixel_height)),
+        )
+        pil_image.close()
+        if bitmap is not None:
             bitmap.close()
-            page.close()
-            pdf.close()
-
-            return PDFConversionResult(
-                png_bytes=png_bytes,
-                had_multiple_pages=had_multiple_pages,
-                pixel_width=pixel_width,
-                pixel_height=pixel_height,
-                page_bbox=page_bbox,
-            )
+        page.close()
+        pdf.close()
+
+        return PDFConversionResult(
+            png_bytes=png_bytes,
+            had_multiple_pages=had_multiple_pages,
+            pixel_width=pixel_width,
+            pixel_height=pixel_height,
+            page_bbox=page_bbox,
+        )
     except (pdfium.PdfiumError, ValueError) as exc:  # type: ignore[attr-defined]
         raise PDFConversionError("PDFium failed to rasterize the document.") from exc
 
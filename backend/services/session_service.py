@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -8,6 +9,18 @@ from typing import Optional
 
 from flask import current_app
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time for session records; second precision is plenty."""
+    return datetime.now(_UTC).isoformat(timespec="seconds")
+
 
 class SessionError(Exception):
     """Base exception raised for session management issues."""
@@ -24,6 +37,15 @@ class SessionService:
         self._sessions_file = sessions_file
         self._sessions_dir = sessions_dir
         self._sessions_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed registry keyed by file mtime: every public method starts
+        # with a load, so without this each create/update/get re-parsed the
+        # whole file even when this process just wrote it.
+        self._cache_mtime: int = -1
+        self._cache_data: Optional[dict] = None
+        # id -> session record, rebuilt alongside the parse cache. Entries
+        # are the same dicts as in data["sessions"], so in-place updates on
+        # a looked-up record are visible to the next save.
+        self._sessions_by_id: dict[int, dict] = {}
 
     @classmethod
     def from_app_config(cls) -> "SessionService":
@@ -54,7 +76,7 @@ class SessionService:
         (session_dir / "uploads").mkdir(parents=True, exist_ok=True)
         
         # Create new session record
-        now = datetime.now(timezone.utc).isoformat()
+        now = _now_iso()
         new_session = {
             "id": data["next_id"],
             "session_name": session_name,
@@ -68,6 +90,7 @@ class SessionService:
         }
         
         data["sessions"].append(new_session)
+        self._sessions_by_id[new_session["id"]] = new_session
         data["next_id"] += 1
         
         # Save updated sessions
@@ -89,11 +112,11 @@ class SessionService:
         Updates paths to geometry_storage and processed_drawing, and update_time.
         """
         data = self._load_sessions_data()
-        
-        session = self._find_session_by_id(data["sessions"], session_id)
+
+        session = self._sessions_by_id.get(session_id)
         if not session:
             raise SessionNotFoundError(f"Session with id {session_id} not found.")
-        
+
         # Update fields
         if geometry_storage is not None:
             session["geometry_storage"] = geometry_storage
@@ -104,7 +127,7 @@ class SessionService:
         if user_comment is not None:
             session["user_comment"] = user_comment
         
-        session["update_time"] = datetime.now(timezone.utc).isoformat()
+        session["update_time"] = _now_iso()
         
         # Save updated sessions
         self._save_sessions_data(data)
@@ -118,14 +141,14 @@ class SessionService:
         Returns session data with paths to processed_drawing and geometry_storage.
         """
         data = self._load_sessions_data()
-        
-        session = self._find_session_by_id(data["sessions"], session_id)
+
+        session = self._sessions_by_id.get(session_id)
         if not session:
             raise SessionNotFoundError(f"Session with id {session_id} not found.")
-        
+
         # Update session status
         session["session_status"] = "active"
-        session["update_time"] = datetime.now(timezone.utc).isoformat()
+        session["update_time"] = _now_iso()
         
         # Save updated sessions
         self._save_sessions_data(data)
@@ -155,8 +178,8 @@ class SessionService:
 
     def get_session(self, session_id: int) -> dict:
         """Get session by ID."""
-        data = self._load_sessions_data()
-        session = self._find_session_by_id(data["sessions"], session_id)
+        self._load_sessions_data()
+        session = self._sessions_by_id.get(session_id)
         if not session:
             raise SessionNotFoundError(f"Session with id {session_id} not found.")
         return session
@@ -167,30 +190,53 @@ class SessionService:
         return data["sessions"]
 
     def _load_sessions_data(self) -> dict:
-        """Load sessions data from JSON file."""
-        if not self._sessions_file.exists():
-            return {"sessions": [], "next_id": 1}
-        
+        """Load sessions data from JSON file, reusing the parse when fresh."""
+        try:
+            mtime = os.stat(self._sessions_file).st_mtime_ns
+        except OSError:
+            data = {"sessions": [], "next_id": 1}
+            self._sessions_by_id = {}
+            return data
+
+        if mtime == self._cache_mtime and self._cache_data is not None:
+            return self._cache_data
+
         try:
-            with open(self._sessions_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(self._sessions_file, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, IOError) as e:
             raise SessionError(f"Failed to load sessions: {e}") from e
 
+        self._cache_mtime = mtime
+        self._cache_data = data
+        self._sessions_by_id = {
+            session["id"]: session for session in data["sessions"]
+        }
+        return data
+
     def _save_sessions_data(self, data: dict) -> None:
-        """Save sessions data to JSON file."""
+        """Save sessions data atomically; a crash never truncates the registry."""
+        if orjson is not None:
+            body = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            body = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
         try:
             self._sessions_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._sessions_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp_path = self._sessions_file.with_name(self._sessions_file.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._sessions_file)
         except IOError as e:
             raise SessionError(f"Failed to save sessions: {e}") from e
 
-    @staticmethod
-    def _find_session_by_id(sessions: list[dict], session_id: int) -> Optional[dict]:
-        """Find session by ID in sessions list."""
-        for session in sessions:
-            if session.get("id") == session_id:
-                return session
-        return None
+        # What we just wrote is the current registry; record the new mtime so
+        # the next load returns this object without touching the file body.
+        self._cache_data = data
+        try:
+            self._cache_mtime = os.stat(self._sessions_file).st_mtime_ns
+        except OSError:
+            self._cache_mtime = -1
 
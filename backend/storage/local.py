@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
+from typing import BinaryIO
 
 from backend.storage.protocols import FileStorageGateway
 
@@ -25,6 +27,17 @@ class LocalFileStorage(FileStorageGateway):
             raise LocalFileStorageError(f"Unable to write file to {target}") from exc
         return target
 
+    def save_stream(self, stream: BinaryIO, destination: Path) -> Path:
+        """Copy a readable binary stream to destination in 1 MiB chunks."""
+        target = self._resolve(destination)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(target, "wb") as out:
+                shutil.copyfileobj(stream, out, length=1 << 20)
+        except OSError as exc:
+            raise LocalFileStorageError(f"Unable to write file to {target}") from exc
+        return target
+
     def exists(self, path: Path) -> bool:
         return self._resolve(path).exists()
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 
 class FileStorageGateway(Protocol):
@@ -10,6 +10,9 @@ class FileStorageGateway(Protocol):
     def save_bytes(self, data: bytes, destination: Path) -> Path:
         ...
 
+    def save_stream(self, stream: BinaryIO, destination: Path) -> Path:
+        ...
+
     def exists(self, path: Path) -> bool:
         ...
 
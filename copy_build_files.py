@@ -10,26 +10,22 @@ if not assets_dir.exists():
     print(f"Assets directory not found: {assets_dir}")
     exit(1)
 
-# Find drafter files
-drafter_js = None
-drafter_css = None
-
-for file in assets_dir.iterdir():
-    if file.name.startswith("drafter") and file.suffix == ".js":
-        drafter_js = file
-    elif file.name.startswith("drafter") and file.suffix == ".css":
-        drafter_css = file
+# Find drafter files; glob stops at the first match
+drafter_js = next(assets_dir.glob("drafter*.js"), None)
+drafter_css = next(assets_dir.glob("drafter*.css"), None)
 
 if drafter_js:
     target_js = static_dist / "drafter.js"
-    shutil.copy2(drafter_js, target_js)
+    # copyfile, not copy2: dist artifacts don't need mtime/mode preserved,
+    # and data-only copies take the kernel fast path (sendfile on Linux)
+    shutil.copyfile(drafter_js, target_js)
     print(f"Copied {drafter_js.name} -> drafter.js")
 else:
     print("Warning: drafter.js not found in assets/")
 
 if drafter_css:
     target_css = static_dist / "drafter.css"
-    shutil.copy2(drafter_css, target_css)
+    shutil.copyfile(drafter_css, target_css)
     print(f"Copied {drafter_css.name} -> drafter.css")
 else:
     print("Warning: drafter.css not found in assets/")
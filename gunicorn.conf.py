@@ -0,0 +1,20 @@
+"""Gunicorn configuration for production deployment.
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+
+The request handlers are I/O bound (per-session JSON files under
+instance/sessions_id_/), so threaded workers let each process keep serving
+requests while another thread waits on disk. File I/O releases the GIL, which
+makes gthread a better fit here than gevent monkey-patching.
+"""
+from __future__ import annotations
+
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = 8
+timeout = 60
+keepalive = 5
+accesslog = "-"